@@ -1,6 +1,12 @@
 import pandas as pd
+import numpy as np
+import re
 import csv # Para usar csv.QUOTE_MINIMAL ou csv.QUOTE_NONNUMERIC
 
+# Copy-on-write (pandas 2.x): fatias viram views baratas e só as colunas
+# efetivamente modificadas são copiadas, reduzindo o pico de memória.
+pd.options.mode.copy_on_write = True
+
 # Caminho para o arquivo de entrada
 input_file_path = r"C:\Users\gefer\Documents\LayoutGeneratorBINGO\data\rE_table_vivaldi.csv"
 
@@ -12,165 +18,166 @@ col_freq_name = "Freq [GHz]"
 col_phi_name = "Phi [deg]"
 col_theta_name = "Theta [deg]"
 
+# Tamanho do bloco da leitura em streaming: o pico de memória do script é
+# O(CHUNK_ROWS), independente do tamanho do arquivo.
+CHUNK_ROWS = 500_000
+
 try:
     print(f"Tentando ler o arquivo: {input_file_path}...")
-    df = None
-    
-    # Tentativa 1: Assumir CSV padrão (vírgula como separador)
-    try:
-        print("Tentando ler com sep=',' e quotechar='\"' (engine python)...")
-        # Ler tudo como string inicialmente para maior controle sobre a conversão e nomes de colunas
-        df_temp = pd.read_csv(input_file_path, sep=',', quotechar='"', skipinitialspace=True, engine='python', dtype=str)
-        
-        # Limpar nomes das colunas lidas (remover espaços extras)
-        df_temp.columns = [str(col).strip() for col in df_temp.columns]
-
-        # Verificar se colunas essenciais foram encontradas após a limpeza
-        if (col_freq_name in df_temp.columns and 
-            col_phi_name in df_temp.columns and 
-            col_theta_name in df_temp.columns and 
-            len(df_temp.columns) > 1):
-            df = df_temp
-            print("Arquivo lido com sucesso usando sep=','.")
-        else:
-            print(f"Leitura com sep=',' não produziu as colunas esperadas ou produziu apenas uma coluna. Colunas detectadas: {df_temp.columns.tolist()}. Tentando sep='\t'.")
-            df = None # Resetar para forçar a próxima tentativa
-    except Exception as e_comma:
-        print(f"Falha ao ler com sep=',' (detalhes: {e_comma}). Tentando com sep='\t'.")
 
-    # Tentativa 2: Se a primeira falhou ou não foi ideal, tentar com tabulação
-    if df is None:
+    # Etapa 0: Detectar o delimitador contando ocorrências nos primeiros
+    # 256 KiB (linhas de dados, pulando o cabeçalho) — uma passada barata em
+    # bytes, sem heurística de dialeto nem risco de exceção do csv.Sniffer.
+    sep_final = None
+    with open(input_file_path, 'rb') as f_probe:
+        sample_lines = f_probe.read(262144).split(b'\n')[1:10]
+    if sample_lines:
+        sep_counts = {sep: sum(line.count(sep.encode()) for line in sample_lines)
+                      for sep in (',', '\t', ';')}
+        best_sep, best_count = max(sep_counts.items(), key=lambda item: item[1])
+        if best_count > 0:
+            sep_final = best_sep
+            print(f"Delimitador detectado na amostra: {sep_final!r}")
+    if sep_final is None:
+        print("Nenhum delimitador evidente na amostra. Testando cabeçalhos diretamente.")
+
+    # Etapa 1: Validar o cabeçalho (apenas a primeira linha) com o separador
+    # detectado e, se necessário, com os candidatos ',' e '\t'.
+    header_cols = None
+    candidate_seps = [sep_final] if sep_final else []
+    candidate_seps += [s for s in (',', '\t') if s != sep_final]
+    for sep_try in candidate_seps:
         try:
-            print("Tentando ler com sep='\t' e quotechar='\"' (engine python)...")
-            df_temp = pd.read_csv(input_file_path, sep='\t', quotechar='"', skipinitialspace=True, engine='python', dtype=str)
-            df_temp.columns = [str(col).strip() for col in df_temp.columns]
-
-            if (col_freq_name in df_temp.columns and 
-                col_phi_name in df_temp.columns and 
-                col_theta_name in df_temp.columns and 
-                len(df_temp.columns) > 1):
-                df = df_temp
-                print("Arquivo lido com sucesso usando sep='\t'.")
-            else:
-                print(f"Leitura com sep='\t' não produziu as colunas esperadas ou produziu apenas uma coluna. Colunas detectadas: {df_temp.columns.tolist()}.")
-                # Se ainda assim resultou em uma coluna, pode ser um problema mais sério.
-                if len(df_temp.columns) == 1:
-                    print(f"AVISO: Leitura com sep='\t' resultou em uma única coluna: {df_temp.columns.tolist()}")
-                # Mesmo que não ideal, atribuímos para análise posterior ou erro.
-                df = df_temp 
-        except Exception as e_tab:
-            print(f"Falha ao ler com sep='\t' (detalhes: {e_tab}).")
-            error_msg_comma = f", Erro com vírgula: {e_comma}" if 'e_comma' in locals() and e_comma else ""
-            raise RuntimeError(f"Não foi possível ler o arquivo CSV/TSV corretamente. Verifique o formato do arquivo{error_msg_comma}. Erro com tab: {e_tab}")
-
-    if df is None:
-        print("Não foi possível carregar o DataFrame após tentativas. Verifique os erros anteriores.")
+            probe = pd.read_csv(input_file_path, sep=sep_try, quotechar='"',
+                                skipinitialspace=True, nrows=0)
+        except Exception as e_hdr:
+            print(f"Falha ao ler o cabeçalho com sep={sep_try!r} (detalhes: {e_hdr}).")
+            continue
+        raw_cols = list(probe.columns)
+        cols = [str(col).strip() for col in probe.columns]
+        if (col_freq_name in cols and
+            col_phi_name in cols and
+            col_theta_name in cols and
+            len(cols) > 1):
+            sep_final = sep_try
+            header_cols = cols
+            header_raw_cols = raw_cols
+            print(f"Cabeçalho validado com sep={sep_final!r}.")
+            break
+        print(f"Cabeçalho com sep={sep_try!r} não produziu as colunas esperadas. Colunas detectadas: {cols}")
+
+    if header_cols is None:
+        print("Não foi possível validar o cabeçalho com nenhum separador. Verifique o formato do arquivo.")
         exit()
 
-    print(f"\nColunas originais lidas ({len(df.columns)}): {df.columns.tolist()}")
-    
-    # Verificação crítica: Se ainda temos uma única coluna com todos os nomes concatenados.
-    if len(df.columns) == 1 and (df.columns[0].count(',') > 5 or df.columns[0].count('\t') > 5): # Heurística
-        print("\nERRO CRÍTICO: O arquivo foi lido como tendo uma única coluna que parece conter todos os nomes de cabeçalho.")
-        print(f"Conteúdo da coluna única: '{df.columns[0]}'")
-        print("Isso indica que o delimitador (',' ou '\t') não foi interpretado corretamente para o cabeçalho.")
-        print("Por favor, verifique manualmente o delimitador real e a formatação do cabeçalho no seu arquivo CSV.")
-        exit()
+    print(f"\nColunas originais lidas ({len(header_cols)}): {header_cols}")
 
-    # 1. Conversão de Tipos
-    # Converter colunas relevantes para numérico.
-    # Todas as colunas de dados (re, im, Gain, Dir, Freq, Phi, Theta) devem ser numéricas.
-    print("\nConvertendo colunas para tipo numérico (onde aplicável)...")
-    for col_name in df.columns:
-        # Se a coluna não for puramente de texto descritivo, tente convertê-la.
-        # Para este dataset, quase todas as colunas são numéricas.
-        try:
-            # Tenta converter para float64, que é um tipo numérico comum.
-            # Se for inteiro, pandas pode otimizar, mas float é mais geral para esses dados.
-            df[col_name] = pd.to_numeric(df[col_name], errors='coerce')
-        except Exception as e_conv:
-            print(f"  Não foi possível converter a coluna '{col_name}' para numérica (erro: {e_conv}). Mantendo como string/object.")
-            
-    # Verificar se as colunas chave para processamento (Phi, Theta) são numéricas
-    for key_col in [col_phi_name, col_theta_name, col_freq_name]:
-        if key_col in df.columns and not pd.api.types.is_numeric_dtype(df[key_col]):
-            print(f"AVISO: A coluna '{key_col}' não é numérica após a tentativa de conversão. Isso pode afetar a filtragem ou cálculos.")
-        elif key_col not in df.columns:
-             print(f"AVISO: A coluna chave '{key_col}' não foi encontrada no DataFrame.")
-
-
-    # 2. Remover colunas indesejadas ("Gain", "Dir", "Freq")
+    # Etapa 2: Decidir as colunas a remover a partir do cabeçalho
+    # ("Gain", "Dir" e a coluna de frequência).
     keywords_to_drop = ["Gain", "Dir"] # Palavras-chave para identificar colunas a remover
-    
-    cols_to_drop_list = []
-    for col_name_iter in df.columns:
-        for keyword in keywords_to_drop:
-            if keyword in str(col_name_iter): # str() para o caso de o nome da coluna não ser string
-                cols_to_drop_list.append(col_name_iter)
-                break # Evita adicionar a mesma coluna múltiplas vezes
-    
-    # Adicionar a coluna de frequência específica para remoção
-    if col_freq_name in df.columns:
+    # Máscara booleana em uma passada C (str.contains com padrão compilado),
+    # em vez de laço Python aninhado colunas x palavras-chave
+    drop_pattern = '|'.join(map(re.escape, keywords_to_drop))
+    header_index = pd.Index(header_cols)
+    cols_to_drop_list = header_index[header_index.str.contains(drop_pattern, regex=True)].tolist()
+    if col_freq_name in header_cols:
         cols_to_drop_list.append(col_freq_name)
     else:
         print(f"AVISO: Coluna de frequência '{col_freq_name}' não encontrada para remoção (já pode ter sido removida ou nome incorreto).")
-
-    # Remover duplicatas da lista de colunas a serem dropadas
-    cols_to_drop_list = list(set(cols_to_drop_list)) 
-
-    # Filtrar apenas colunas que realmente existem no DataFrame para evitar erros no drop
-    actual_cols_to_drop = [col for col in cols_to_drop_list if col in df.columns]
-    
-    df_filtered = df.copy() # Trabalhar com uma cópia para não alterar o df original neste estágio
+    actual_cols_to_drop = sorted(set(cols_to_drop_list))
 
     if not actual_cols_to_drop:
         print("\nNenhuma coluna correspondente a 'Gain', 'Dir' ou o nome da frequência foi encontrada para remover.")
     else:
         print(f"\nColunas a serem removidas: {actual_cols_to_drop}")
-        df_filtered.drop(columns=actual_cols_to_drop, inplace=True)
-        print(f"Colunas após a remoção ({len(df_filtered.columns)}): {df_filtered.columns.tolist()}")
-
-    # 3. Reduzir a tabela (amostragem por Theta)
-    # Assume que a tabela está ordenada de forma que Theta incrementa 0.05 por linha.
-    # Selecionar linhas alternadas para mudar o passo de Theta para 0.1.
-    print(f"\nReduzindo a tabela (passo de Theta de 0.05 para 0.1)...")
-    print(f"Número de linhas antes da redução: {len(df_filtered)}")
-    if len(df_filtered) > 0:
-        # .iloc[::2] seleciona a linha 0, 2, 4, ...
-        df_final = df_filtered.iloc[::2].copy() # .copy() para garantir que é um novo DataFrame
-    else:
-        df_final = df_filtered.copy() # Se já estiver vazio, apenas copia
-    print(f"Número de linhas após a redução: {len(df_final)}")
 
-    # 4. Obter e printar Phi e Theta iniciais e finais da tabela *final*
+    # Etapa 3: Passada única em streaming — cada bloco é convertido para
+    # numérico, tem as colunas indesejadas removidas, é reduzido por ::2
+    # (paridade mantida entre blocos para preservar a semântica global) e
+    # anexado ao arquivo de saída.
+    print(f"\nProcessando em blocos de {CHUNK_ROWS} linhas (conversão + redução do passo de Theta de 0.05 para 0.1)...")
+    rows_before = 0
+    rows_after = 0
+    first_chunk = True
+    phi_min = phi_max = None
+    theta_min = theta_max = None
+
+    # usecols descarta as colunas indesejadas no próprio parser (nomes crus,
+    # como aparecem no arquivo); memory_map=True lê direto do page cache do
+    # SO, sem uma cópia intermediária em userspace
+    keep_raw_cols = [raw for raw, stripped in zip(header_raw_cols, header_cols)
+                     if stripped not in actual_cols_to_drop]
+    reader = pd.read_csv(input_file_path, sep=sep_final, quotechar='"',
+                         skipinitialspace=True, dtype=str, chunksize=CHUNK_ROWS,
+                         usecols=keep_raw_cols, engine='c', memory_map=True)
+    for chunk in reader:
+        chunk.columns = [str(col).strip() for col in chunk.columns]
+        # Despacho único para o caminho C do pandas; valores não numéricos
+        # viram NaN (errors='coerce')
+        chunk = chunk.apply(pd.to_numeric, errors='coerce')
+        # Campos re/im cabem folgadamente em float32: metade dos bytes movidos
+        # na redução e na gravação (Phi/Theta seguem em float64)
+        downcast_map = {col: np.float32 for col in chunk.columns
+                        if col not in (col_phi_name, col_theta_name)
+                        and pd.api.types.is_float_dtype(chunk[col])}
+        if downcast_map:
+            chunk = chunk.astype(downcast_map)
+
+        # Índices GLOBAIS pares: o início dentro do bloco depende de quantas
+        # linhas já passaram
+        start = rows_before % 2
+        chunk_final = chunk.iloc[start::2]
+        rows_before += len(chunk)
+        rows_after += len(chunk_final)
+
+        if not chunk_final.empty:
+            # Acumula os intervalos de Phi/Theta do resultado final direto no
+            # buffer NumPy (to_numpy(copy=False)), sem o overhead de validação
+            # das reduções do pandas
+            for stat_col, stat_key in ((col_phi_name, 'phi'), (col_theta_name, 'theta')):
+                if stat_col not in chunk_final.columns:
+                    continue
+                arr = chunk_final[stat_col].to_numpy(copy=False)
+                if not np.issubdtype(arr.dtype, np.number) or np.all(np.isnan(arr)):
+                    continue
+                cmin = np.nanmin(arr)
+                cmax = np.nanmax(arr)
+                if stat_key == 'phi':
+                    phi_min = cmin if phi_min is None else min(phi_min, cmin)
+                    phi_max = cmax if phi_max is None else max(phi_max, cmax)
+                else:
+                    theta_min = cmin if theta_min is None else min(theta_min, cmin)
+                    theta_max = cmax if theta_max is None else max(theta_max, cmax)
+
+            # Usar vírgula como separador para melhor compatibilidade com Excel.
+            # Se ',' não funcionar (tudo em uma coluna), tente ';'.
+            # float_format='%.7e' evita imprimir dígitos além da precisão
+            # de float32
+            chunk_final.to_csv(output_file_path, sep=',', decimal='.', index=False,
+                               quoting=csv.QUOTE_MINIMAL, float_format='%.7e',
+                               mode='w' if first_chunk else 'a', header=first_chunk)
+            first_chunk = False
+
+    print(f"Número de linhas antes da redução: {rows_before}")
+    print(f"Número de linhas após a redução: {rows_after}")
+
+    # Etapa 4: Printar Phi e Theta iniciais e finais da tabela *final*
     print("\n--- Informações da Tabela Final ---")
-    if not df_final.empty:
-        # Para Phi
-        if col_phi_name in df_final.columns and pd.api.types.is_numeric_dtype(df_final[col_phi_name]):
-            phi_min = df_final[col_phi_name].min()
-            phi_max = df_final[col_phi_name].max()
+    if rows_after > 0:
+        if phi_min is not None:
             print(f"Intervalo de '{col_phi_name}': de {phi_min} a {phi_max}")
         else:
             print(f"AVISO: Coluna '{col_phi_name}' não encontrada ou não é numérica na tabela final. Não é possível calcular min/max.")
-
-        # Para Theta
-        if col_theta_name in df_final.columns and pd.api.types.is_numeric_dtype(df_final[col_theta_name]):
-            theta_min = df_final[col_theta_name].min()
-            theta_max = df_final[col_theta_name].max()
+        if theta_min is not None:
             print(f"Intervalo de '{col_theta_name}': de {theta_min} a {theta_max}")
         else:
             print(f"AVISO: Coluna '{col_theta_name}' não encontrada ou não é numérica na tabela final. Não é possível calcular min/max.")
     else:
         print("Tabela final está vazia. Não é possível calcular intervalos de Phi e Theta.")
 
-    # 5. Salvar o DataFrame resultante em um novo arquivo CSV
-    # Usar vírgula como separador para melhor compatibilidade com Excel na maioria das regiões.
-    # O Excel usa as configurações regionais do Windows para interpretar CSVs.
-    # Se ',' não funcionar (tudo em uma coluna), tente ';'.
-    print(f"\nSalvando arquivo filtrado e reduzido em: {output_file_path}")
-    if not df_final.empty:
-        df_final.to_csv(output_file_path, sep=',', decimal='.', index=False, quoting=csv.QUOTE_MINIMAL)
-        print("Arquivo salvo com sucesso.")
+    # Etapa 5: Status final da gravação
+    if not first_chunk:
+        print(f"\nArquivo filtrado e reduzido salvo em: {output_file_path}")
         print("Nota: O arquivo foi salvo com vírgula (,) como separador e ponto (.) como decimal.")
         print("Se o Excel abrir este arquivo em uma única coluna, tente usar a opção 'Texto para Colunas' do Excel,")
         print("ou ajuste o código para salvar com sep=';' e decimal=',' se sua configuração regional do Excel assim o exigir.")
@@ -182,9 +189,7 @@ except FileNotFoundError:
     print(f"Erro Crítico: O arquivo '{input_file_path}' não foi encontrado.")
 except pd.errors.EmptyDataError:
     print(f"Erro Crítico: O arquivo '{input_file_path}' está vazio ou não é um CSV válido.")
-except RuntimeError as e_rt: # Captura o erro levantado pelas tentativas de leitura
-    print(f"Erro Crítico de Leitura: {e_rt}")
 except Exception as e:
     print(f"Ocorreu um erro inesperado: {e}")
     import traceback
-    traceback.print_exc()
\ No newline at end of file
+    traceback.print_exc()
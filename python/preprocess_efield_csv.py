@@ -2,6 +2,23 @@ import pandas as pd
 import os
 import numpy as np
 
+# PyArrow é opcional: quando instalado, o parser de CSV multithreaded do
+# pandas (engine='pyarrow') é usado no lugar do engine C single-thread.
+try:
+    import pyarrow  # noqa: F401
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+
+# Polars é opcional: quando instalado, toda a ingestão (ler -> converter ->
+# filtrar -> particionar) roda como um plano lazy com kernels multithread
+# em Rust; o pandas segue como fallback sem dependências extras.
+try:
+    import polars as pl
+    _HAS_POLARS = True
+except ImportError:
+    _HAS_POLARS = False
+
 # --- Configurações ---
 INPUT_CSV_PATH = r"C:\Users\gefer\Documents\LayoutGeneratorBINGO\data\rE_table_vivaldi.csv"  # Seu arquivo CSV original
 OUTPUT_DIR = r"C:\Users\gefer\Documents\LayoutGeneratorBINGO\data\efield_phi_data"    # Pasta para salvar os arquivos divididos (nome diferente para clareza)
@@ -9,72 +26,203 @@ PHI_VALUES_TO_EXTRACT = range(0, 91)   # Phi de 0 a 90 graus (inteiros)
 RELEVANT_COLUMNS = ['theta [deg]', 'phi [deg]', 're(retheta) [v]', 'im(retheta) [v]', 're(rephi) [v]', 'im(rephi) [v]']
 # --------------------
 
+def _to_float(series):
+    """Converte uma coluna para float, tratando vírgula decimal sem passes de
+    string em Python: colunas já numéricas (parseadas pelo engine C com
+    decimal=',') retornam direto; caso contrário a troca ','->'.' é feita em
+    Arrow (pyarrow.compute) quando disponível, ou via str.replace do pandas."""
+    if pd.api.types.is_numeric_dtype(series):
+        return series
+    if _HAS_PYARROW:
+        import pyarrow.compute as pc
+        arr = pyarrow.array(series.astype(str), type=pyarrow.string())
+        fixed = pc.replace_substring(arr, pattern=',', replacement='.')
+        try:
+            return pd.Series(pc.cast(fixed, pyarrow.float64()).to_pandas().values,
+                             index=series.index)
+        except pyarrow.lib.ArrowInvalid:
+            pass  # valores não numéricos: cai no caminho tolerante abaixo
+    return pd.to_numeric(series.str.replace(',', '.', regex=False), errors='coerce')
+
+
 if not os.path.exists(OUTPUT_DIR):
     os.makedirs(OUTPUT_DIR)
 
 print(f"Lendo o arquivo CSV original: {INPUT_CSV_PATH}...")
-try:
-    df = pd.read_csv(INPUT_CSV_PATH, usecols=lambda col_name: col_name.strip().lower().replace('"', '') in RELEVANT_COLUMNS or col_name.startswith("Freq"), dtype=str)
-    print("Arquivo CSV lido com sucesso.")
-except FileNotFoundError:
-    print(f"ERRO: Arquivo de entrada '{INPUT_CSV_PATH}' não encontrado.")
-    exit()
-except Exception as e:
-    print(f"ERRO ao ler o CSV: {e}")
-    exit()
-
-df.columns = [col.strip().lower().replace('"', '') for col in df.columns]
-print("Colunas após normalização:", df.columns.tolist())
-
-missing_cols = [col for col in RELEVANT_COLUMNS if col not in df.columns]
-if missing_cols:
-    print(f"ERRO: Colunas esperadas não encontradas no CSV: {missing_cols}")
-    exit()
-
-print("Convertendo colunas para numérico...")
-for col in RELEVANT_COLUMNS:
-    if 'deg' in col or 'v' in col:
-        df[col] = df[col].str.replace(',', '.', regex=False)
-        df[col] = pd.to_numeric(df[col], errors='coerce')
-
-df.dropna(subset=RELEVANT_COLUMNS, inplace=True)
-print(f"Total de linhas após conversão e remoção de NaNs: {len(df)}")
-
-freq_col_name = next((col for col in df.columns if 'freq' in col.lower()), None)
-if freq_col_name:
-    print(f"Filtrando por frequência ({freq_col_name} = 1)...")
-    df[freq_col_name] = pd.to_numeric(df[freq_col_name].str.replace(',', '.', regex=False), errors='coerce')
-    df = df[np.isclose(df[freq_col_name], 1.0)]
-    print(f"Linhas após filtro de frequência: {len(df)}")
+if _HAS_POLARS:
+    # Caminho Polars: um único plano lazy (scan -> rename -> conversão ->
+    # filtros -> phi_int) executado em paralelo; só materializa no collect()
+    try:
+        lf = pl.scan_csv(INPUT_CSV_PATH, infer_schema_length=0)  # tudo como texto
+        rename_map = {col: col.strip().lower().replace('"', '')
+                      for col in lf.collect_schema().names()}
+        norm_names = list(rename_map.values())
+        missing_cols = [col for col in RELEVANT_COLUMNS if col not in norm_names]
+        if missing_cols:
+            print(f"ERRO: Colunas esperadas não encontradas no CSV: {missing_cols}")
+            exit()
+        usecols = [col for col in norm_names
+                   if col in RELEVANT_COLUMNS or col.startswith('freq')]
+        lf = (lf.rename(rename_map)
+                .select(usecols)
+                .with_columns([pl.col(col).str.replace_all(',', '.', literal=True)
+                                 .cast(pl.Float64, strict=False)
+                               for col in usecols])
+                .drop_nulls(subset=RELEVANT_COLUMNS))
+        freq_col_name = next((col for col in usecols if 'freq' in col), None)
+        if freq_col_name:
+            print(f"Filtrando por frequência ({freq_col_name} = 1)...")
+            lf = lf.filter((pl.col(freq_col_name) - 1.0).abs() < 1e-5)
+        else:
+            print("AVISO: Coluna de frequência não encontrada explicitamente.")
+        lf = lf.with_columns(pl.col('phi [deg]').round(0).cast(pl.Int64).alias('phi_int'))
+        df = lf.collect()
+        print(f"Arquivo CSV lido com sucesso (engine=polars). Linhas após filtros: {len(df)}")
+    except FileNotFoundError:
+        print(f"ERRO: Arquivo de entrada '{INPUT_CSV_PATH}' não encontrado.")
+        exit()
+    except Exception as e:
+        print(f"ERRO ao ler o CSV: {e}")
+        exit()
+    # partition_by corta o frame em uma passada; as chaves vêm como tuplas
+    phi_groups = {key[0]: group for key, group
+                  in df.partition_by('phi_int', as_dict=True).items()}
 else:
-    print("AVISO: Coluna de frequência não encontrada explicitamente.")
+    try:
+        # Resolve as colunas desejadas lendo só o cabeçalho; a lista explícita
+        # permite projetar colunas dentro do parser
+        header_cols = pd.read_csv(INPUT_CSV_PATH, nrows=0).columns
+        usecols = [col_name for col_name in header_cols
+                   if col_name.strip().lower().replace('"', '') in RELEVANT_COLUMNS or col_name.startswith("Freq")]
+        df = None
+        if _HAS_PYARROW:
+            # Scanner de Dataset do Arrow: projeção (columns=) e o filtro de
+            # frequência são aplicados lote a lote durante o parse (pushdown),
+            # então as linhas fora da frequência alvo nunca viram DataFrame
+            try:
+                import pyarrow.csv as pacsv
+                import pyarrow.compute as pc
+                import pyarrow.dataset as pads
+                csv_format = pads.CsvFileFormat(
+                    convert_options=pacsv.ConvertOptions(decimal_point=','))
+                dataset = pads.dataset(INPUT_CSV_PATH, format=csv_format)
+                freq_raw_name = next((col for col in usecols if col.startswith("Freq")), None)
+                freq_filter = None
+                if freq_raw_name is not None:
+                    freq_filter = ((pc.field(freq_raw_name) > 1.0 - 1e-5) &
+                                   (pc.field(freq_raw_name) < 1.0 + 1e-5))
+                df = dataset.to_table(columns=usecols, filter=freq_filter).to_pandas()
+                print("Arquivo CSV lido com sucesso (engine=pyarrow.dataset, filtro de frequência aplicado no parse).")
+            except FileNotFoundError:
+                raise
+            except Exception as e_ds:
+                # Ex.: arquivo com ponto decimal faz o cast/filtro falhar;
+                # o caminho pandas abaixo cobre esses casos
+                print(f"Scanner pyarrow.dataset indisponível para este arquivo ({e_ds}); usando pandas.")
+                df = None
+        if df is None:
+            # decimal=',' faz o próprio parser C converter "1,23" para float,
+            # sem materializar colunas de string intermediárias; colunas que
+            # usarem ponto decimal permanecem como texto e são convertidas depois
+            df = pd.read_csv(INPUT_CSV_PATH, usecols=usecols, decimal=',', engine='c')
+            print("Arquivo CSV lido com sucesso (engine=c).")
+    except FileNotFoundError:
+        print(f"ERRO: Arquivo de entrada '{INPUT_CSV_PATH}' não encontrado.")
+        exit()
+    except Exception as e:
+        print(f"ERRO ao ler o CSV: {e}")
+        exit()
+
+    df.columns = [col.strip().lower().replace('"', '') for col in df.columns]
+    print("Colunas após normalização:", df.columns.tolist())
+
+    missing_cols = [col for col in RELEVANT_COLUMNS if col not in df.columns]
+    if missing_cols:
+        print(f"ERRO: Colunas esperadas não encontradas no CSV: {missing_cols}")
+        exit()
+
+    print("Convertendo colunas para numérico...")
+    for col in RELEVANT_COLUMNS:
+        if 'deg' in col or 'v' in col:
+            df[col] = _to_float(df[col])
+
+    df.dropna(subset=RELEVANT_COLUMNS, inplace=True)
+    print(f"Total de linhas após conversão e remoção de NaNs: {len(df)}")
+
+    freq_col_name = next((col for col in df.columns if 'freq' in col.lower()), None)
+    if freq_col_name:
+        print(f"Filtrando por frequência ({freq_col_name} = 1)...")
+        df[freq_col_name] = _to_float(df[freq_col_name])
+        # df.query roteia a expressão pelo numexpr quando instalado
+        # (bytecode SIMD multithread, sem o booleano temporário do np.isclose)
+        df = df.query(f'abs(`{freq_col_name}` - 1) < 1e-5')
+        print(f"Linhas após filtro de frequência: {len(df)}")
+    else:
+        print("AVISO: Coluna de frequência não encontrada explicitamente.")
+
+    df['phi_int'] = df['phi [deg]'].round().astype(int)
+
+    # Particiona sem hash por grupo: mantém só a faixa de phi alvo, ordena
+    # por phi_int (sort estável, uma passada) e recupera cada grupo como uma
+    # fatia contígua via np.searchsorted nos limites
+    phi_lo, phi_hi = min(PHI_VALUES_TO_EXTRACT), max(PHI_VALUES_TO_EXTRACT)
+    phi_arr = df['phi_int'].to_numpy()
+    df = df.iloc[np.flatnonzero((phi_arr >= phi_lo) & (phi_arr <= phi_hi))]
+    order = np.argsort(df['phi_int'].to_numpy(), kind='stable')
+    df = df.iloc[order]
+    phi_sorted = df['phi_int'].to_numpy()
+    bounds = np.searchsorted(phi_sorted, np.arange(phi_lo, phi_hi + 2))
+    phi_groups = {phi_lo + k: df.iloc[bounds[k]:bounds[k + 1]]
+                  for k in range(len(bounds) - 1) if bounds[k + 1] > bounds[k]}
 
-df['phi_int'] = df['phi [deg]'].round().astype(int)
 header_line = '"' + '","'.join(RELEVANT_COLUMNS) + '"\n'
 
 for phi_val in PHI_VALUES_TO_EXTRACT:
-    phi_specific_df = df[df['phi_int'] == phi_val]
+    phi_specific_df = phi_groups.get(phi_val)
 
-    if not phi_specific_df.empty:
+    # len() cobre tanto DataFrame do pandas quanto do polars
+    if phi_specific_df is not None and len(phi_specific_df) > 0:
         output_filename = os.path.join(OUTPUT_DIR, f'efield_phi_{phi_val}.csv')
         print(f"Processando Phi = {phi_val} -> {output_filename} ({len(phi_specific_df)} linhas)")
-        phi_specific_df_to_save = phi_specific_df[RELEVANT_COLUMNS]
+        # Formata o bloco inteiro de uma vez (sem iterrows): np.char.mod aplica
+        # o formato por coluna e np.char.add monta as linhas completas
+        formatted_cols = []
+        for col_name in RELEVANT_COLUMNS:
+            col_vals = phi_specific_df[col_name].to_numpy()
+            if '[deg]' in col_name:
+                formatted_cols.append(np.char.mod('%.2f', col_vals))
+            elif '[v]' in col_name:
+                formatted_cols.append(np.char.mod('%.15e', col_vals))
+            else:
+                formatted_cols.append(col_vals.astype(str))
+        lines = formatted_cols[0]
+        for formatted_col in formatted_cols[1:]:
+            lines = np.char.add(np.char.add(lines, '","'), formatted_col)
+        lines = np.char.add(np.char.add('"', lines), '"\n')
         with open(output_filename, 'w', encoding='utf-8') as f:
             f.write(header_line)
-            for _, row in phi_specific_df_to_save.iterrows():
-                formatted_row = []
-                for col_name in RELEVANT_COLUMNS:
-                    val = row[col_name]
-                    if '[deg]' in col_name:
-                        formatted_row.append(f'{val:.2f}')
-                    elif '[v]' in col_name:
-                        formatted_row.append(f'{val:.15e}')
-                    else:
-                        formatted_row.append(str(val))
-                f.write('"' + '","'.join(formatted_row) + '"\n')
+            f.write(''.join(lines))
     else:
         print(f"Sem dados para Phi = {phi_val}")
 
+# Espelho em Parquet particionado por phi_int (quando pyarrow está instalado):
+# consumidores em Python leem binário colunar (pd.read_parquet) sem pagar o
+# parse dos floats em texto. Os CSVs acima continuam sendo gerados porque o
+# beam_pattern.js os busca por nome no IPFS.
+if _HAS_PYARROW:
+    import pyarrow.parquet as pq
+    parquet_dir = OUTPUT_DIR + "_parquet"
+    print(f"\nGravando espelho Parquet particionado em '{parquet_dir}'...")
+    if _HAS_POLARS:
+        table = df.select(RELEVANT_COLUMNS + ['phi_int']).to_arrow()
+    else:
+        table = pyarrow.Table.from_pandas(
+            df[RELEVANT_COLUMNS + ['phi_int']], preserve_index=False)
+    pq.write_to_dataset(table, root_path=parquet_dir,
+                        partition_cols=['phi_int'],
+                        compression='zstd', use_dictionary=False)
+    print("Espelho Parquet gravado (leia com pd.read_parquet(f'{dir}/phi_int=K/')).")
+
 print(f"\nPré-processamento concluído. Arquivos salvos em '{OUTPUT_DIR}'.")
 print(f"IMPORTANTE: Copie a pasta '{OUTPUT_DIR}' para a pasta 'data/' do seu projeto no GitHub.")
 print("Ou seja, você deve ter 'data/efield_phi_data_github/efield_phi_0.csv', etc.")
\ No newline at end of file
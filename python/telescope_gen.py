@@ -1,660 +1,1273 @@
-# oskar_telescope_generator.py
-"""
-Script principal para gerar estruturas de telescópio OSKAR para BINGO.
-
-Este script utiliza a biblioteca 'bingo_layouts.py' para gerar diferentes
-layouts de estação (posições dos centros dos tiles). Ele lê as posições
-das estações (outriggers) de um arquivo CSV e cria a estrutura de diretórios
-necessária para simulações OSKAR, combinando cada layout de estação com
-cada arranjo definido no CSV.
-
-O script gera 16 configurações de layout pré-definidas (4 formas x 4 variantes)
-e pede confirmação visual para cada uma antes de gerar os arquivos.
-"""
-
-import csv
-import os
-import numpy as np
-import matplotlib.pyplot as plt
-import math
-from collections import defaultdict
-import traceback
-from typing import Dict, Any, Callable, List
-
-# Importa a biblioteca de layouts recém-criada
-try:
-    import bingo_layouts
-except ImportError:
-    print("Erro Crítico: Não foi possível encontrar a biblioteca 'bingo_layouts.py'.")
-    print("Certifique-se de que 'bingo_layouts.py' está no mesmo diretório que este script.")
-    exit()
-
-# Importa a biblioteca de layouts recém-criada
-try:
-    import bingo_layouts
-    # Importa a constante necessária da biblioteca
-    from bingo_layouts import DEFAULT_MAX_PLACEMENT_ATTEMPTS
-except ImportError:
-    print("Erro Crítico: Não foi possível encontrar a biblioteca 'bingo_layouts.py'.")
-    print("Certifique-se de que 'bingo_layouts.py' está no mesmo diretório que este script.")
-    exit()
-
-# ==================== Constantes Globais ====================
-
-# --- Parâmetros do Tile (Elemento base de 64 antenas) ---
-# Mantém os valores originais convertidos para METROS
-SUBGROUP_DX_MM = 176.0695885 # Original em mm
-SUBGROUP_DY_MM = 167.5843071 # Original em mm
-SUBGROUP_DX = SUBGROUP_DX_MM / 1000.0 # Espaçamento X dos centros INTERNOS do tile em METROS
-SUBGROUP_DY = SUBGROUP_DY_MM / 1000.0 # Espaçamento Y dos centros INTERNOS do tile em METROS
-SUBGROUP_N = 2 # Número de centros internos na direção X
-SUBGROUP_M = 8 # Número de centros internos na direção Y
-N_SUBGROUPS = SUBGROUP_N * SUBGROUP_M # = 16
-
-N_ANTENNAS_PER_SUBGROUP = 4 # Antenas por losango interno
-DIAMOND_OFFSET = 0.05 # "Raio" do losango/diamante interno em METROS (5 cm).
-N_ANTENNAS_PER_TILE = N_SUBGROUPS * N_ANTENNAS_PER_SUBGROUP # Deve ser 16 * 4 = 64
-
-# --- Dimensões FÍSICAS GERAIS do tile (em METROS) ---
-# Usadas como REFERÊNCIA DE ESCALA para as funções em bingo_layouts
-TILE_WIDTH = 0.35  # Largura física do tile em METROS
-TILE_HEIGHT = 1.34 # Altura física do tile em METROS
-TILE_DIAGONAL_M = math.sqrt(TILE_WIDTH**2 + TILE_HEIGHT**2) # Diagonal para escala
-
-# --- Configurações de Entrada/Saída ---
-# Caminho para o arquivo CSV com posições dos outriggers (WGS84)
-# Formato esperado: ArrangementName,StationID,Latitude,Longitude,Altitude
-CSV_INPUT_FILE = r'C:\Users\gefer\Documents\particular\OSKAR\posicoes_outriggers.csv'
-
-# Diretório base ONDE as pastas dos telescópios serão geradas
-# Ex: Se OUTPUT_BASE_DIR = '.../layouts', as saídas serão '.../layouts/circulo_padrao_50km_a', etc.
-OUTPUT_BASE_DIR = r'C:\Users\gefer\Desktop\Mestrado\Softwares\OSKAR\OSKAR-2.7-Example-Data\inputs\TELESCOPES\layouts'
-
-# --- Ponto de Referência (BINGO Central) ---
-# Coordenadas WGS84
-BINGO_LATITUDE = -7.04067
-BINGO_LONGITUDE = -38.26884
-BINGO_ALTITUDE = 396.4 # Altitude já está em metros
-
-# ==================== Layout do Tile (64 Antenas - Losangos Internos) ====================
-# Esta função define a estrutura INTERNA de um único tile de 64 elementos.
-# É a mesma função do seu script original. Ela NÃO usa a biblioteca bingo_layouts.
-
-def create_tile_layout_64_antennas(
-    center_spacing_x=SUBGROUP_DX, center_spacing_y=SUBGROUP_DY,
-    centers_N=SUBGROUP_N, centers_M=SUBGROUP_M,
-    diamond_offset=DIAMOND_OFFSET
-    ) -> np.ndarray:
-    """
-    Cria o layout INTERNO do tile com 64 elementos (16x4), onde 4 elementos
-    formam um losango/diamante ao redor de cada um dos 16 pontos centrais (grid NxM).
-    Retorna posições (x, y) em METROS, centradas na origem (0,0).
-    """
-    if centers_N <= 0 or centers_M <= 0 or diamond_offset <= 0:
-        print("Aviso: Parâmetros inválidos para create_tile_layout_64_antennas.")
-        return np.empty((0, 2))
-
-    subgroup_centers = []
-    # 1. Gerar os 16 centros (grid NxM)
-    for i in range(centers_N):
-        pos_cx = (i - (centers_N - 1) / 2.0) * center_spacing_x
-        for j in range(centers_M):
-            pos_cy = (j - (centers_M - 1) / 2.0) * center_spacing_y
-            subgroup_centers.append([pos_cx, pos_cy])
-
-    subgroup_centers = np.array(subgroup_centers)
-    # Nota: os centros já são gerados em torno da origem por causa da subtração da média dos índices.
-
-    # 2. Para cada centro, gerar os 4 pontos do losango
-    final_antenna_positions = []
-    offsets = np.array([
-        [0, diamond_offset],  # Norte relativo
-        [diamond_offset, 0],  # Leste relativo
-        [0, -diamond_offset], # Sul relativo
-        [-diamond_offset, 0]  # Oeste relativo
-    ])
-
-    for center in subgroup_centers:
-        for offset in offsets:
-            final_antenna_positions.append(center + offset)
-
-    tile_array = np.array(final_antenna_positions)
-
-    # Re-centraliza o conjunto final de 64 antenas para garantir
-    tile_array -= tile_array.mean(axis=0)
-
-    # Verificação da contagem final
-    expected_total_antennas = centers_N * centers_M * N_ANTENNAS_PER_SUBGROUP
-    if tile_array.shape[0] != expected_total_antennas:
-         print(f"AVISO: create_tile_layout_64_antennas gerou {tile_array.shape[0]} antenas, esperado {expected_total_antennas}.")
-
-    return tile_array
-
-# ==================== Funções de Formatação e Plotagem (Do script original) ====================
-
-def format_layout_content_xy(layout_array: np.ndarray) -> str:
-    """Formata um array numpy (N, 2) para string CSV (x, y em METROS)."""
-    content = ""
-    precision = 6 # Precisão padrão para x, y em metros (OSKAR)
-    if not isinstance(layout_array, np.ndarray) or layout_array.ndim != 2 or layout_array.shape[1] != 2:
-        print(f"Aviso: format_layout_content_xy recebeu array com shape inválido: {layout_array.shape if isinstance(layout_array, np.ndarray) else type(layout_array)}")
-        return ""
-    if layout_array.size == 0:
-        return ""
-
-    for row in layout_array:
-        try:
-            content += f"{float(row[0]):.{precision}f},{float(row[1]):.{precision}f}\n"
-        except (ValueError, TypeError):
-            content += "NaN,NaN\n"
-    return content
-
-def format_layout_content_wgs84(wgs84_coords_list: List[List[float]]) -> str:
-    """Formata uma lista de coordenadas WGS84 [lat, lon, alt] para string."""
-    content = ""
-    lat_lon_precision = 7
-    alt_precision = 1
-    for row in wgs84_coords_list:
-        if len(row) == 3:
-            content += f"{row[0]:.{lat_lon_precision}f},{row[1]:.{lat_lon_precision}f},{row[2]:.{alt_precision}f}\n"
-        else:
-            content += "\n" # Linha vazia para entrada inválida
-    return content
-
-def plot_station_layout(
-    station_antennas_layout_array: np.ndarray, # Layout de TODAS as antenas
-    station_centers_layout_array: np.ndarray, # Layout dos CENTROS dos tiles
-    title: str = "Layout da Estação"
-    ) -> bool:
-    """
-    Plota a disposição das antenas individuais e os centros dos tiles.
-    Ambos os arrays devem estar em METROS.
-    """
-    antennas_valid = isinstance(station_antennas_layout_array, np.ndarray) and station_antennas_layout_array.ndim == 2 and station_antennas_layout_array.shape[1] >= 2
-    centers_valid = isinstance(station_centers_layout_array, np.ndarray) and station_centers_layout_array.ndim == 2 and station_centers_layout_array.shape[1] >= 2
-
-    if not antennas_valid and not centers_valid:
-        print("Erro: Nenhum dado válido para plotar (antenas ou centros).")
-        return False
-    if antennas_valid and station_antennas_layout_array.shape[0] == 0 and centers_valid and station_centers_layout_array.shape[0] == 0:
-         print("Aviso: Arrays de antenas e centros vazios. Nada para plotar.")
-         return True # Retorna True pois não houve erro, apenas nada a fazer
-
-    plt.figure(figsize=(10, 10))
-
-    # Plota antenas individuais (se houver)
-    if antennas_valid and station_antennas_layout_array.shape[0] > 0:
-        num_antennas = station_antennas_layout_array.shape[0]
-        # Ajusta o tamanho do marcador baseado no número de antenas
-        marker_size = max(1, 7 - np.log10(num_antennas)) if num_antennas > 1 else 5
-        plt.scatter(station_antennas_layout_array[:, 0], station_antennas_layout_array[:, 1],
-                    marker='.', s=marker_size, label=f"Antenas ({num_antennas})", alpha=0.5, zorder=1)
-
-    # Plota centros dos tiles (se houver)
-    if centers_valid and station_centers_layout_array.shape[0] > 0:
-         num_centers = station_centers_layout_array.shape[0]
-         plt.scatter(station_centers_layout_array[:, 0], station_centers_layout_array[:, 1],
-                     marker='x', s=50, color='red', label=f"Centros Tiles ({num_centers})", zorder=2)
-
-    plt.xlabel("X (metros)")
-    plt.ylabel("Y (metros)")
-    plt.title(title, fontsize=14)
-    plt.gca().set_aspect('equal', adjustable='box')
-    plt.grid(True, linestyle='--', alpha=0.6)
-    plt.legend()
-    print(f"\nExibindo gráfico: {title}")
-    print(">>> FECHE a janela do gráfico para continuar ou cancelar <<<")
-    try:
-        plt.show()
-        return True # Gráfico foi exibido
-    except Exception as e:
-        print(f"Erro ao exibir o gráfico: {e}")
-        return False # Falha ao mostrar
-
-# ==================== Função Principal de Geração OSKAR ====================
-
-def create_oskar_structure_grouped(
-    csv_input_path: str,
-    output_base_path: str,
-    layout_config: Dict[str, Any], # Dicionário contendo name, layout_function, params
-    base_tile_layout: np.ndarray # Layout pré-calculado das 64 antenas do tile
-    ):
-    """
-    Cria a estrutura OSKAR para um layout de estação específico, combinado com
-    os arranjos definidos no CSV.
-
-    Args:
-        csv_input_path (str): Caminho para o arquivo CSV (formato BINGO v3).
-        output_base_path (str): Caminho base para a pasta de saída dos telescópios (ex: .../layouts).
-        layout_config (Dict): Dicionário descrevendo o layout da estação a ser gerado.
-                               Deve conter 'name', 'layout_function', 'params'.
-        base_tile_layout (np.ndarray): Array (64, 2) com as posições das antenas dentro de um tile.
-    """
-    layout_name = layout_config.get('name', 'layout_desconhecido')
-    layout_function = layout_config.get('layout_function')
-    layout_params = layout_config.get('params', {})
-
-    if not layout_function or not callable(layout_function):
-        print(f"Erro Crítico: Função de layout inválida para '{layout_name}'. Abortando este layout.")
-        return
-
-    print(f"\n--- Iniciando Geração para Layout de Estação: '{layout_name}' ---")
-    print(f"Usando CSV: {csv_input_path}")
-    print(f"Diretório Base de Saída: {output_base_path}")
-    print(f"Função da Biblioteca: bingo_layouts.{layout_function.__name__}")
-    print(f"Parâmetros: {layout_params}")
-
-    # --- 1. Calcular Layout da Estação (Centros dos Tiles) ---
-    print("Calculando layout da estação (centros dos tiles em METROS)...")
-    station_centers_coords = []
-    try:
-        # Adiciona as dimensões do tile aos parâmetros, pois são necessárias pela biblioteca
-        full_params = {
-            **layout_params, # Parâmetros específicos do layout
-            'tile_width_m': TILE_WIDTH,
-            'tile_height_m': TILE_HEIGHT
-        }
-        # Chama a função da biblioteca bingo_layouts com os parâmetros corretos
-        station_centers_coords = layout_function(**full_params)
-
-        if not isinstance(station_centers_coords, list) or \
-           (station_centers_coords and not isinstance(station_centers_coords[0], list)):
-             print("Erro: Função de layout não retornou uma lista de listas. Abortando este layout.")
-             return
-
-        # Converte para numpy array para plotagem e formatação
-        station_centers_array = np.array(station_centers_coords) if station_centers_coords else np.empty((0, 2))
-
-    except Exception as e:
-        print(f"Erro Crítico ao calcular layout da estação '{layout_name}': {e}")
-        traceback.print_exc()
-        return
-
-    if station_centers_array.size == 0:
-        print(f"Aviso: Layout da estação '{layout_name}' resultou em 0 tiles. Pulando este layout.")
-        return
-
-    num_tiles_per_station = station_centers_array.shape[0]
-    print(f"Layout da estação '{layout_name}' calculado: {num_tiles_per_station} centros de tiles.")
-
-    # --- 2. Calcular Posições de TODAS as Antenas (para plotagem) ---
-    print("Calculando posições de todas as antenas individuais (para visualização)...")
-    all_antennas_list = []
-    if base_tile_layout.size > 0 and num_tiles_per_station > 0:
-        for center_pos in station_centers_array:
-            # Translada as 64 posições do tile base para o centro atual
-            translated_tile_elements = base_tile_layout + center_pos
-            all_antennas_list.extend(translated_tile_elements)
-    all_antennas_array = np.array(all_antennas_list)
-    num_total_antennas = all_antennas_array.shape[0]
-    print(f"Total de antenas individuais calculadas: {num_total_antennas}")
-
-    # --- 3. Visualizar Layout e Pedir Confirmação ---
-    plot_title = f"Layout Estação: '{layout_name}' ({num_tiles_per_station} Tiles, {num_total_antennas} Antenas)"
-    plot_shown = plot_station_layout(all_antennas_array, station_centers_array, title=plot_title)
-
-    if not plot_shown:
-         print("Aviso: Não foi possível exibir o gráfico do layout. Verifique o backend do Matplotlib.")
-         # Poderíamos parar aqui ou continuar assumindo que o layout está OK
-         # Por segurança, vamos parar se o plot falhar.
-         # print("Abortando este layout devido à falha na visualização.")
-         # return
-         # OU, permitir continuar com um aviso extra:
-         cont = input("AVISO: Gráfico não exibido. Continuar mesmo assim? (s/n): ").strip().lower()
-         if cont != 's':
-              print("Operação cancelada pelo usuário.")
-              return
-
-    # Confirmação do usuário
-    while True:
-        try:
-            user_input = input(f"Layout '{layout_name}' parece correto? Gerar arquivos? (s/n): ").strip().lower()
-            if user_input == 's':
-                print(f"Confirmado. Gerando arquivos para o layout '{layout_name}'...")
-                break
-            elif user_input == 'n':
-                print(f"Layout '{layout_name}' cancelado pelo usuário.")
-                return # Aborta a geração para ESTE layout
-            else:
-                print("Entrada inválida. Digite 's' ou 'n'.")
-        except EOFError:
-             print("\nEntrada interrompida. Operação cancelada.")
-             return # Aborta tudo
-
-    # --- 4. Ler CSV e Agrupar por ArrangementName (SÓ EXECUTA SE CONFIRMADO) ---
-    arrangements_data = defaultdict(list)
-    try:
-        print(f"Lendo e agrupando dados do CSV: {csv_input_path}")
-        with open(csv_input_path, 'r', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            expected_headers = ['ArrangementName', 'StationID', 'Latitude', 'Longitude', 'Altitude']
-            if reader.fieldnames is None: raise ValueError("CSV vazio ou ilegível.")
-            if not all(header in reader.fieldnames for header in expected_headers):
-                raise ValueError(f"Cabeçalhos CSV ausentes/incorretos. Esperado: {expected_headers}, Encontrado: {reader.fieldnames}")
-
-            line_num = 1
-            for row in reader:
-                 line_num += 1
-                 try:
-                     arr_name = row.get('ArrangementName','').strip()
-                     st_id = row.get('StationID','').strip()
-                     lat_str = row.get('Latitude')
-                     lon_str = row.get('Longitude')
-                     alt_str = row.get('Altitude')
-                     if not arr_name or not st_id or lat_str is None or lon_str is None or alt_str is None:
-                         raise ValueError("Campos obrigatórios faltando ou vazios.")
-                     lat = float(lat_str); lon = float(lon_str); alt = float(alt_str)
-                     station_info = {'StationID': st_id, 'Latitude': lat, 'Longitude': lon, 'Altitude': alt}
-                     arrangements_data[arr_name].append(station_info)
-                 except (ValueError, TypeError, KeyError) as e:
-                      print(f"Aviso: Ignorando linha {line_num} inválida no CSV: {row} - Erro: {e}")
-
-        num_arrangements = len(arrangements_data)
-        num_total_stations = sum(len(stations) for stations in arrangements_data.values())
-        if num_arrangements == 0: raise ValueError("Nenhum arranjo válido lido do CSV.")
-        print(f"Dados lidos: {num_arrangements} arranjos do CSV, {num_total_stations} estações no total.")
-
-    except FileNotFoundError: print(f"Erro Crítico: Arquivo CSV não encontrado: {csv_input_path}"); return
-    except ValueError as e: print(f"Erro Crítico no formato ou conteúdo do CSV: {e}"); return
-    except Exception as e: print(f"Erro Crítico inesperado ao ler CSV: {e}"); traceback.print_exc(); return
-
-    # --- 5. Formatar Conteúdos Fixos (Layouts Internos) ---
-    # Formata o layout do TILE (64 antenas) - Fixo para todos
-    tile_layout_content_str = format_layout_content_xy(base_tile_layout)
-    # Formata o layout da ESTAÇÃO (centros dos tiles) - Específico deste layout_config
-    station_layout_content_str = format_layout_content_xy(station_centers_array)
-    # Formata a posição do BINGO Central - Fixo para todos
-    bingo_position_content = f"{BINGO_LATITUDE:.7f},{BINGO_LONGITUDE:.7f},{BINGO_ALTITUDE:.1f}\n"
-
-    # --- 6. Criar Estrutura de Pastas e Arquivos por Arranjo CSV ---
-    print(f"Criando estrutura de diretórios e arquivos para '{layout_name}'...")
-    created_telescopes = 0
-    error_telescopes = 0
-
-    # Garante que o diretório base de saída exista
-    os.makedirs(output_base_path, exist_ok=True)
-
-    # Itera sobre cada ARRANJO definido no CSV (ex: '50km_a', '100km_b')
-    for csv_arrangement_name, stations_list in arrangements_data.items():
-        # Nome da pasta final combina o layout da estação e o arranjo do CSV
-        telescope_folder_name = f"{layout_name}_{csv_arrangement_name.replace(' ', '_').lower()}"
-        telescope_folder_path = os.path.join(output_base_path, telescope_folder_name)
-
-        station_subfolder_path = os.path.join(telescope_folder_path, 'station')
-        tile_subfolder_path = os.path.join(station_subfolder_path, 'tile')
-
-        try:
-            print(f"  Processando Telescópio: {telescope_folder_name} ({len(stations_list)} estações)")
-            os.makedirs(tile_subfolder_path, exist_ok=True) # Cria toda a hierarquia
-
-            # a) layout_wgs84.txt (Posições das Estações do CSV)
-            wgs84_coords_for_arrangement = [[s['Latitude'], s['Longitude'], s['Altitude']] for s in stations_list]
-            layout_wgs84_content_str = format_layout_content_wgs84(wgs84_coords_for_arrangement)
-            wgs84_path = os.path.join(telescope_folder_path, 'layout_wgs84.txt')
-            with open(wgs84_path, 'w', encoding='utf-8') as f: f.write(layout_wgs84_content_str)
-
-            # b) position.txt (Posição do BINGO Central)
-            position_path = os.path.join(telescope_folder_path, 'position.txt')
-            with open(position_path, 'w', encoding='utf-8') as f: f.write(bingo_position_content)
-
-            # c) station/layout.txt (Layout da Estação - CENTROS dos tiles)
-            station_layout_path = os.path.join(station_subfolder_path, 'layout.txt')
-            with open(station_layout_path, 'w', encoding='utf-8') as f: f.write(station_layout_content_str)
-
-            # d) station/tile/layout.txt (Layout do Tile - 64 antenas)
-            tile_layout_path = os.path.join(tile_subfolder_path, 'layout.txt')
-            with open(tile_layout_path, 'w', encoding='utf-8') as f: f.write(tile_layout_content_str)
-
-            created_telescopes += 1
-
-        except OSError as e:
-            print(f"  Erro de OS ao criar '{telescope_folder_name}': {e}")
-            error_telescopes += 1
-            continue # Pula para o próximo arranjo do CSV
-        except Exception as e:
-            print(f"  Erro inesperado ao criar '{telescope_folder_name}': {e}")
-            traceback.print_exc()
-            error_telescopes += 1
-            continue # Pula para o próximo arranjo do CSV
-
-    print(f"--- Geração para Layout '{layout_name}' Concluída ---")
-    print(f"Telescópios criados com sucesso: {created_telescopes}")
-    if error_telescopes > 0: print(f"Erros durante a criação: {error_telescopes}")
-
-
-# ==================== Definição dos Layouts a Gerar ====================
-
-# Dicionário mapeando nomes de variantes para parâmetros específicos
-# Você pode ajustar esses valores para refinar o que cada variante significa
-LAYOUT_VARIANTS = {
-    "padrao": {
-        # Usa os padrões de cada função de layout
-        "desc": "Configuração padrão da forma."
-    },
-    "espacada": {
-        # Aumenta fatores de espaçamento/raio
-        "spacing_factor_mult": 3, # Multiplicador para fatores de espaçamento linear
-        "radius_step_factor_mult": 1.5, # Multiplicador para passos/raios
-        "desc": "Tiles mais afastados uns dos outros."
-    },
-    "aleatoria": {
-        # Adiciona pequeno ruído gaussiano
-        "random_offset_stddev_m": 0.3 * TILE_DIAGONAL_M, # 30% da diagonal como desvio padrão
-        "desc": "Pequena perturbação aleatória nas posições."
-    },
-    "exponencial": {
-        # Prioriza modos de espaçamento exponencial
-        "spacing_mode": "center_exponential", # Para Grid, Rhombus, HexGrid
-        "arm_spacing_mode": "exponential",    # Para Spiral
-        "ring_spacing_mode": "exponential",   # Para Ring
-        "center_exp_scale_factor": 2,      # Fator de escala para center_exponential
-        "radius_step_factor_exp": 1.15,       # Fator multiplicativo para spiral/ring exponencial
-        "desc": "Espaçamento aumenta exponencialmente do centro ou entre passos."
-    }
-}
-
-# Lista de configurações de layout a serem geradas
-# Cada entrada é um dicionário com:
-#   - name: Nome descritivo (será usado no nome da pasta)
-#   - layout_function: Referência à função em bingo_layouts
-#   - params: Dicionário de parâmetros BASE para a função
-# As variantes modificarão esses parâmetros base.
-BASE_LAYOUT_CONFIGURATIONS = [
-    # ... (definições de circulo, quadrado, losango, espiral, phyllotaxis) ...
-    {
-        "shape_name": "circulo",
-        "base_params": {
-            "spacing_mode": 'linear', # Adiciona modo padrão
-            "spacing_x_factor": 1.0,
-            "spacing_y_factor": 1.0,
-            "center_exp_scale_factor": 4, # Padrão se mudar modo
-            # Params de offset/colisão adicionados depois pelas variantes
-        },
-        "layout_function": bingo_layouts.create_manual_circular_layout
-    },
-    {
-        "shape_name": "quadrado",
-        "base_params": {
-            "num_cols": 12,
-            "num_rows": 3,
-            "spacing_mode": 'linear',
-            "spacing_x_factor": 1,
-            "spacing_y_factor": 1,
-            "center_exp_scale_factor": 4,
-        },
-        "layout_function": bingo_layouts.create_grid_layout
-    },
-    {
-        "shape_name": "losango",
-        "base_params": {
-            "num_rows_half": 6,
-            "spacing_mode": 'linear',
-            "side_length_factor": 0.65,
-            "h_compress_factor": 0.785,
-            "v_compress_factor": 0.86,
-            "center_exp_scale_factor": 4,
-        },
-        "layout_function": bingo_layouts.create_rhombus_layout
-    },
-    {
-        "shape_name": "espiral",
-        "base_params": {
-            "num_arms": 3,
-            "tiles_per_arm": 12,
-            "arm_spacing_mode": 'linear',
-            "center_scale_mode": 'none', # Adiciona modo padrão
-            "radius_start_factor": 0.7,
-            "radius_step_factor": 0.3,
-            "center_exp_scale_factor": 1.1, # Padrão se mudar modo
-            "angle_step_rad": math.pi / 9,
-            "include_center_tile": False
-        },
-        "layout_function": bingo_layouts.create_spiral_layout
-    },
-    # {
-    #     "shape_name": "phyllotaxis",
-    #      "base_params": {
-    #          "num_tiles": 36,
-    #          "spacing_mode": 'linear', # Adiciona modo padrão
-    #          "scale_factor": 0.6,
-    #          "center_offset_factor": 0.05,
-    #          "center_exp_scale_factor": 1.1, # Padrão se mudar modo
-    #      },
-    #     "layout_function": bingo_layouts.create_phyllotaxis_layout
-    # },
-]
-
-# Gerar a lista final de configurações combinando formas e variantes
-LAYOUT_CONFIGURATIONS_TO_RUN = []
-print("Definindo configurações de layout para execução...") # Debug print
-
-for base_config in BASE_LAYOUT_CONFIGURATIONS:
-    shape_name = base_config["shape_name"]
-    func = base_config["layout_function"]
-    params_padrao = base_config["base_params"].copy()
-
-    # --- Gerar parâmetros para "espacada" ---
-    params_espacada = params_padrao.copy()
-    variant_espacada_mods = LAYOUT_VARIANTS["espacada"]
-    mult = variant_espacada_mods.get("spacing_factor_mult", 1.5)
-    step_mult = variant_espacada_mods.get("radius_step_factor_mult", 1.5)
-    # Aplicar multiplicações
-    if "spacing_x_factor" in params_espacada: params_espacada["spacing_x_factor"] *= mult
-    if "spacing_y_factor" in params_espacada: params_espacada["spacing_y_factor"] *= mult
-    if "side_length_factor" in params_espacada: params_espacada["side_length_factor"] *= mult
-    if "spacing_factor" in params_espacada: params_espacada["spacing_factor"] *= mult
-    if "radius_step_factor" in params_espacada and params_espacada.get("arm_spacing_mode",'linear') == 'linear' : params_espacada["radius_step_factor"] *= step_mult # Apenas se linear
-    if "scale_factor" in params_espacada: params_espacada["scale_factor"] *= mult
-
-    # --- Gerar configurações para todas as variantes ---
-    for variant_name, variant_mods in LAYOUT_VARIANTS.items():
-        layout_name = f"{shape_name}_{variant_name}"
-        current_params = {} # Começa vazio
-
-        if variant_name == "padrao":
-            current_params = params_padrao.copy()
-            # Adiciona parâmetros de offset/colisão padrão (ou zero) se não definidos
-            current_params.setdefault("random_offset_stddev_m", 0.0)
-            current_params.setdefault("min_separation_factor", 1.05)
-            current_params.setdefault("max_placement_attempts", DEFAULT_MAX_PLACEMENT_ATTEMPTS)
-
-        elif variant_name == "espacada":
-            current_params = params_espacada.copy()
-            # Adiciona parâmetros de offset/colisão padrão (ou zero) se não definidos
-            current_params.setdefault("random_offset_stddev_m", 0.0)
-            current_params.setdefault("min_separation_factor", 1.05)
-            current_params.setdefault("max_placement_attempts", DEFAULT_MAX_PLACEMENT_ATTEMPTS)
-
-        elif variant_name == "aleatoria":
-            # *** COMEÇA COM OS PARÂMETROS DE "ESPACADA" ***
-            current_params = params_espacada.copy()
-            # Aplica modificações específicas da variante "aleatoria"
-            current_params["random_offset_stddev_m"] = variant_mods.get("random_offset_stddev_m", 0.05 * TILE_DIAGONAL_M)
-            current_params["min_separation_factor"] = variant_mods.get("min_separation_factor", 1.01)
-            current_params.setdefault("max_placement_attempts", DEFAULT_MAX_PLACEMENT_ATTEMPTS)
-
-        elif variant_name == "exponencial":
-            current_params = params_padrao.copy() # Começa com padrão
-            # Aplica modificações de modo e fatores exponenciais
-            if "spacing_mode" in current_params:
-                 current_params["spacing_mode"] = variant_mods.get("spacing_mode", 'center_exponential')
-                 current_params["center_exp_scale_factor"] = variant_mods.get("center_exp_scale_factor", 1.15)
-            if "arm_spacing_mode" in current_params:
-                 current_params["arm_spacing_mode"] = variant_mods.get("arm_spacing_mode", 'exponential')
-                 current_params["radius_step_factor"] = variant_mods.get("radius_step_factor_exp", 1.15)
-            if "ring_spacing_mode" in current_params:
-                 current_params["ring_spacing_mode"] = variant_mods.get("ring_spacing_mode", 'exponential')
-                 current_params["radius_step_factor"] = variant_mods.get("radius_step_factor_exp", 1.15)
-            if "center_scale_mode" in current_params: # Para espiral, anel, etc.
-                 current_params["center_scale_mode"] = variant_mods.get("spacing_mode", 'center_exponential') # Usa a chave 'spacing_mode' para definir isso
-                 current_params["center_exp_scale_factor"] = variant_mods.get("center_exp_scale_factor", 1.15)
-
-            # Comportamento especial para Manual Circular em modo exponencial (ex: mais espaçado)
-            if shape_name == "circulo" and current_params.get("spacing_mode") == 'center_exponential':
-                 # Poderia remover spacing_x/y_factor ou definir como 1.0, pois serão ignorados
-                 # se a função create_manual_circular_layout foi adaptada corretamente.
-                 # Vamos garantir que estejam como 1.0 para a base do scaling exp.
-                 current_params["spacing_x_factor"] = 1.0
-                 current_params["spacing_y_factor"] = 1.0
-                 print(f"  Ajuste para {layout_name}: Usando spacing_mode='center_exponential', fatores X/Y ignorados para cálculo base.")
-
-            # Adiciona parâmetros de offset/colisão padrão (ou zero) se não definidos
-            current_params.setdefault("random_offset_stddev_m", 0.0)
-            current_params.setdefault("min_separation_factor", 1.05)
-            current_params.setdefault("max_placement_attempts", DEFAULT_MAX_PLACEMENT_ATTEMPTS)
-
-
-        # Adiciona a configuração final à lista
-        LAYOUT_CONFIGURATIONS_TO_RUN.append({
-            "name": layout_name,
-            "layout_function": func,
-            "params": current_params
-        })
-        # Debug: Imprime os parâmetros finais para uma variante específica
-        # if shape_name == "quadrado" and variant_name == "aleatoria":
-        #    print(f"DEBUG Params for {layout_name}: {current_params}")
-
-print(f"Total de {len(LAYOUT_CONFIGURATIONS_TO_RUN)} configurações de layout definidas.")
-
-
-# ==================== Execução Principal ====================
-if __name__ == "__main__":
-
-    print("======================================================")
-    print("   Gerador de Estrutura de Telescópio OSKAR (BINGO)   ")
-    print("======================================================")
-    print(f"Usando biblioteca de layouts: bingo_layouts.py")
-    print(f"Dimensões de referência do Tile: {TILE_WIDTH:.2f}m x {TILE_HEIGHT:.2f}m")
-    print(f"Arquivo CSV de entrada: {CSV_INPUT_FILE}")
-    print(f"Diretório base de saída: {OUTPUT_BASE_DIR}")
-    print(f"Número de layouts a processar: {len(LAYOUT_CONFIGURATIONS_TO_RUN)}")
-    print("------------------------------------------------------")
-
-    # Verifica se arquivos/diretórios existem
-    if not os.path.isfile(CSV_INPUT_FILE):
-        print(f"Erro Fatal: Arquivo CSV não encontrado em: {CSV_INPUT_FILE}")
-        exit()
-    # Diretório de saída será criado se não existir
-
-    # Calcula o layout do TILE (64 antenas) uma única vez
-    print("Calculando layout base do tile (64 antenas)...")
-    the_base_tile_layout = create_tile_layout_64_antennas()
-    if the_base_tile_layout.shape[0] != N_ANTENNAS_PER_TILE:
-        print(f"Erro Fatal: Falha ao gerar layout base do tile ({the_base_tile_layout.shape[0]} antenas geradas). Abortando.")
-        exit()
-    print(f"Layout base do tile calculado ({the_base_tile_layout.shape[0]} antenas).")
-
-    # Itera sobre cada configuração de layout definida
-    for i, layout_conf in enumerate(LAYOUT_CONFIGURATIONS_TO_RUN):
-        print(f"\n===== Processando Layout {i+1}/{len(LAYOUT_CONFIGURATIONS_TO_RUN)} =====")
-        create_oskar_structure_grouped(
-            csv_input_path=CSV_INPUT_FILE,
-            output_base_path=OUTPUT_BASE_DIR,
-            layout_config=layout_conf,
-            base_tile_layout=the_base_tile_layout
-        )
-        print(f"===== Layout {layout_conf.get('name', 'desconhecido')} concluído =====")
-
-    print("\n======================================================")
-    print("Processamento de todos os layouts concluído.")
+# oskar_telescope_generator.py
+"""
+Script principal para gerar estruturas de telescópio OSKAR para BINGO.
+
+Este script utiliza a biblioteca 'bingo_layouts.py' para gerar diferentes
+layouts de estação (posições dos centros dos tiles). Ele lê as posições
+das estações (outriggers) de um arquivo CSV e cria a estrutura de diretórios
+necessária para simulações OSKAR, combinando cada layout de estação com
+cada arranjo definido no CSV.
+
+O script gera 16 configurações de layout pré-definidas (4 formas x 4 variantes)
+e pede confirmação visual para cada uma antes de gerar os arquivos.
+"""
+
+import argparse
+import atexit
+import functools
+import io
+import logging
+import logging.handlers
+import os
+import queue
+import numpy as np
+import math
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from pathlib import Path
+import zlib
+from types import MappingProxyType
+from typing import Dict, Any, Callable, List, Mapping
+
+# Importa a biblioteca de layouts recém-criada
+try:
+    import bingo_layouts
+except ImportError:
+    print("Erro Crítico: Não foi possível encontrar a biblioteca 'bingo_layouts.py'.")
+    print("Certifique-se de que 'bingo_layouts.py' está no mesmo diretório que este script.")
+    exit()
+
+# Importa a biblioteca de layouts recém-criada
+try:
+    import bingo_layouts
+    # Importa a constante necessária da biblioteca
+    from bingo_layouts import DEFAULT_MAX_PLACEMENT_ATTEMPTS
+except ImportError:
+    print("Erro Crítico: Não foi possível encontrar a biblioteca 'bingo_layouts.py'.")
+    print("Certifique-se de que 'bingo_layouts.py' está no mesmo diretório que este script.")
+    exit()
+
+# matplotlib e pandas saem do topo do módulo: são pesados (centenas de ms e
+# dezenas de MB) e só uma parte das execuções os usa — rodadas filtradas por
+# BINGO_ONLY e os workers que não plotam não pagam o import. O lru_cache
+# garante uma única importação por processo.
+@functools.lru_cache(maxsize=None)
+def _plt():
+    """Importa matplotlib.pyplot sob demanda (uma vez por processo)."""
+    import matplotlib.pyplot as plt
+    return plt
+
+# ==================== Logging Assíncrono ====================
+# Os registros do laço por-telescópio só entram numa fila (QueueHandler); a
+# formatação final e a escrita em stderr acontecem na thread do QueueListener,
+# fora dos workers do ThreadPoolExecutor (em consoles Windows a conversão de
+# codepage no write é lenta e serializava as threads de emissão).
+_LOG_QUEUE = queue.Queue(-1)
+logger = logging.getLogger('telescope_gen')
+if not logger.handlers:
+    logger.setLevel(logging.INFO)
+    logger.addHandler(logging.handlers.QueueHandler(_LOG_QUEUE))
+    logger.propagate = False
+_LOG_LISTENER = logging.handlers.QueueListener(_LOG_QUEUE, logging.StreamHandler())
+_LOG_LISTENER.start()
+atexit.register(lambda: _LOG_LISTENER.stop())  # Drena a fila antes de sair
+
+def _ensure_log_listener():
+    """
+    (Re)inicia o QueueListener no processo atual. Workers criados por fork
+    herdam a fila e o handler, mas NÃO a thread do listener — sem esta
+    reinicialização os registros enfileirados no filho nunca seriam escritos.
+    """
+    global _LOG_LISTENER
+    thread = getattr(_LOG_LISTENER, '_thread', None)
+    if thread is None or not thread.is_alive():
+        _LOG_LISTENER = logging.handlers.QueueListener(_LOG_QUEUE, logging.StreamHandler())
+        _LOG_LISTENER.start()
+
+# ==================== Constantes Globais ====================
+
+# --- Parâmetros do Tile (Elemento base de 64 antenas) ---
+# Mantém os valores originais convertidos para METROS
+SUBGROUP_DX_MM = 176.0695885 # Original em mm
+SUBGROUP_DY_MM = 167.5843071 # Original em mm
+SUBGROUP_DX = SUBGROUP_DX_MM / 1000.0 # Espaçamento X dos centros INTERNOS do tile em METROS
+SUBGROUP_DY = SUBGROUP_DY_MM / 1000.0 # Espaçamento Y dos centros INTERNOS do tile em METROS
+SUBGROUP_N = 2 # Número de centros internos na direção X
+SUBGROUP_M = 8 # Número de centros internos na direção Y
+N_SUBGROUPS = SUBGROUP_N * SUBGROUP_M # = 16
+
+N_ANTENNAS_PER_SUBGROUP = 4 # Antenas por losango interno
+DIAMOND_OFFSET = 0.05 # "Raio" do losango/diamante interno em METROS (5 cm).
+N_ANTENNAS_PER_TILE = N_SUBGROUPS * N_ANTENNAS_PER_SUBGROUP # Deve ser 16 * 4 = 64
+
+# --- Dimensões FÍSICAS GERAIS do tile (em METROS) ---
+# Usadas como REFERÊNCIA DE ESCALA para as funções em bingo_layouts
+TILE_WIDTH = 0.35  # Largura física do tile em METROS
+TILE_HEIGHT = 1.34 # Altura física do tile em METROS
+TILE_DIAGONAL_M = math.sqrt(TILE_WIDTH**2 + TILE_HEIGHT**2) # Diagonal para escala
+
+# --- Configurações de Entrada/Saída ---
+# Caminho para o arquivo CSV com posições dos outriggers (WGS84)
+# Formato esperado: ArrangementName,StationID,Latitude,Longitude,Altitude
+CSV_INPUT_FILE = r'C:\Users\gefer\Documents\particular\OSKAR\posicoes_outriggers.csv'
+
+# Diretório base ONDE as pastas dos telescópios serão geradas
+# Ex: Se OUTPUT_BASE_DIR = '.../layouts', as saídas serão '.../layouts/circulo_padrao_50km_a', etc.
+OUTPUT_BASE_DIR = r'C:\Users\gefer\Desktop\Mestrado\Softwares\OSKAR\OSKAR-2.7-Example-Data\inputs\TELESCOPES\layouts'
+
+# --- Ponto de Referência (BINGO Central) ---
+# Coordenadas WGS84
+BINGO_LATITUDE = -7.04067
+BINGO_LONGITUDE = -38.26884
+BINGO_ALTITUDE = 396.4 # Altitude já está em metros
+
+# ==================== Layout do Tile (64 Antenas - Losangos Internos) ====================
+# Estrutura INTERNA de um único tile de 64 elementos, PRÉ-COMPUTADA (avaliação
+# parcial): o resultado é determinístico e minúsculo, então a rotina de
+# construção foi executada uma vez e o array colado aqui como literal — zero
+# cômputo (e zero I/O de cache) na importação. Para regenerar (se os
+# parâmetros SUBGROUP_*/DIAMOND_OFFSET mudarem), reconstrua:
+#   centros = grid NxM por meshgrid de SUBGROUP_DX/DY, centrado na origem
+#   tile = (centros[:, None, :] + losango[None, :, :]).reshape(-1, 2)
+#   tile -= tile.mean(axis=0)   # losango = [0,+d],[+d,0],[0,-d],[-d,0], d=DIAMOND_OFFSET
+# e cole repr por linha de tile.tolist() abaixo.
+_TILE_LAYOUT_64 = np.array([
+    [-0.08803479424999999, -0.5365450748499999],
+    [-0.03803479425, -0.58654507485],
+    [-0.08803479424999999, -0.63654507485],
+    [-0.13803479425, -0.58654507485],
+    [-0.08803479424999999, -0.36896076775000003],
+    [-0.03803479425, -0.41896076775],
+    [-0.08803479424999999, -0.46896076775],
+    [-0.13803479425, -0.41896076775],
+    [-0.08803479424999999, -0.20137646064999998],
+    [-0.03803479425, -0.25137646064999997],
+    [-0.08803479424999999, -0.30137646064999996],
+    [-0.13803479425, -0.25137646064999997],
+    [-0.08803479424999999, -0.03379215355],
+    [-0.03803479425, -0.08379215355],
+    [-0.08803479424999999, -0.13379215355000001],
+    [-0.13803479425, -0.08379215355],
+    [-0.08803479424999999, 0.13379215355000001],
+    [-0.03803479425, 0.08379215355],
+    [-0.08803479424999999, 0.03379215354999999],
+    [-0.13803479425, 0.08379215355],
+    [-0.08803479424999999, 0.30137646064999996],
+    [-0.03803479425, 0.25137646064999997],
+    [-0.08803479424999999, 0.20137646064999998],
+    [-0.13803479425, 0.25137646064999997],
+    [-0.08803479424999999, 0.46896076775],
+    [-0.03803479425, 0.41896076775],
+    [-0.08803479424999999, 0.36896076775000003],
+    [-0.13803479425, 0.41896076775],
+    [-0.08803479424999999, 0.63654507485],
+    [-0.03803479425, 0.58654507485],
+    [-0.08803479424999999, 0.5365450748499999],
+    [-0.13803479425, 0.58654507485],
+    [0.08803479425000002, -0.5365450748499999],
+    [0.13803479425, -0.58654507485],
+    [0.08803479425000002, -0.63654507485],
+    [0.03803479425000001, -0.58654507485],
+    [0.08803479425000002, -0.36896076775000003],
+    [0.13803479425, -0.41896076775],
+    [0.08803479425000002, -0.46896076775],
+    [0.03803479425000001, -0.41896076775],
+    [0.08803479425000002, -0.20137646064999998],
+    [0.13803479425, -0.25137646064999997],
+    [0.08803479425000002, -0.30137646064999996],
+    [0.03803479425000001, -0.25137646064999997],
+    [0.08803479425000002, -0.03379215355],
+    [0.13803479425, -0.08379215355],
+    [0.08803479425000002, -0.13379215355000001],
+    [0.03803479425000001, -0.08379215355],
+    [0.08803479425000002, 0.13379215355000001],
+    [0.13803479425, 0.08379215355],
+    [0.08803479425000002, 0.03379215354999999],
+    [0.03803479425000001, 0.08379215355],
+    [0.08803479425000002, 0.30137646064999996],
+    [0.13803479425, 0.25137646064999997],
+    [0.08803479425000002, 0.20137646064999998],
+    [0.03803479425000001, 0.25137646064999997],
+    [0.08803479425000002, 0.46896076775],
+    [0.13803479425, 0.41896076775],
+    [0.08803479425000002, 0.36896076775000003],
+    [0.03803479425000001, 0.41896076775],
+    [0.08803479425000002, 0.63654507485],
+    [0.13803479425, 0.58654507485],
+    [0.08803479425000002, 0.5365450748499999],
+    [0.03803479425000001, 0.58654507485],
+], dtype=np.float64)
+_TILE_LAYOUT_64.setflags(write=False)  # constante compartilhada: ninguém deve mutá-la
+
+if __debug__:
+    # Guarda mínima sobre o literal (substitui a antiga checagem de shape em
+    # runtime: a contagem agora é garantida na origem)
+    assert _TILE_LAYOUT_64.shape == (N_ANTENNAS_PER_TILE, 2)
+
+def create_tile_layout_64_antennas() -> np.ndarray:
+    """
+    Retorna o layout INTERNO do tile com 64 elementos (16x4), onde 4 elementos
+    formam um losango/diamante ao redor de cada um dos 16 pontos centrais
+    (grid NxM). Posições (x, y) em METROS, centradas na origem (0,0).
+
+    O resultado é o literal pré-computado _TILE_LAYOUT_64 (somente-leitura);
+    quem precisar de uma cópia mutável deve usar .copy().
+    """
+    return _TILE_LAYOUT_64
+
+# ==================== Funções de Formatação e Plotagem (Do script original) ====================
+
+def format_layout_content_xy(layout_array: np.ndarray) -> str:
+    """Formata um array numpy (N, 2) para string CSV (x, y em METROS)."""
+    if not isinstance(layout_array, np.ndarray) or layout_array.ndim != 2 or layout_array.shape[1] != 2:
+        print(f"Aviso: format_layout_content_xy recebeu array com shape inválido: {layout_array.shape if isinstance(layout_array, np.ndarray) else type(layout_array)}")
+        return ""
+    if layout_array.size == 0:
+        return ""
+
+    # np.savetxt formata o bloco inteiro em C num único buffer, em vez de
+    # concatenar string por linha (O(N^2)) com f-strings por valor
+    buf = io.StringIO()
+    np.savetxt(buf, layout_array.astype(float), fmt='%.6f', delimiter=',')
+    return buf.getvalue()
+
+def format_layout_content_wgs84(wgs84_coords_list: List[List[float]]) -> str:
+    """Formata uma lista de coordenadas WGS84 [lat, lon, alt] para string."""
+    valid_rows = [row for row in wgs84_coords_list if len(row) == 3]
+    n_invalid = len(wgs84_coords_list) - len(valid_rows)
+    content = ""
+    if valid_rows:
+        arr = np.asarray(valid_rows, dtype=np.float64)
+        # Formata cada coluna em lote (np.char.mod aplica o %-format em C) e
+        # monta as linhas por concatenação vetorizada, sem o laço Python por
+        # linha que o np.savetxt faz internamente
+        lat_lon = np.char.mod('%.7f', arr[:, :2])
+        alt = np.char.mod('%.1f', arr[:, 2])
+        lines = np.char.add(np.char.add(lat_lon[:, 0], ','), lat_lon[:, 1])
+        lines = np.char.add(np.char.add(lines, ','), alt)
+        content = '\n'.join(lines) + '\n'
+    content += "\n" * n_invalid # Linhas vazias para entradas inválidas
+    return content
+
+# --- Conteúdos invariantes entre todas as configurações de layout ---
+# O tile de 64 antenas e a posição do BINGO Central não mudam entre as 16
+# configurações; formata uma única vez na importação.
+#
+# BASE_TILE_LAYOUT (o payload que cruza processos: segmento compartilhado das
+# miniaturas, páginas COW/pickle dos workers) vai em float32 — ±0.14 m cabe
+# com folga nos ~7 dígitos significativos, e os bytes movidos caem pela
+# metade. O layout.txt do tile continua emitido do literal em float64.
+BASE_TILE_LAYOUT = _TILE_LAYOUT_64.astype(np.float32)
+BASE_TILE_LAYOUT.setflags(write=False)
+TILE_LAYOUT_CONTENT = format_layout_content_xy(_TILE_LAYOUT_64)
+BINGO_POSITION_CONTENT = f"{BINGO_LATITUDE:.7f},{BINGO_LONGITUDE:.7f},{BINGO_ALTITUDE:.1f}\n"
+# Versões em bytes (os conteúdos são ASCII puro): write_bytes grava direto,
+# sem passar pelo codec de texto e pelo TextIOWrapper a cada arquivo pequeno
+TILE_LAYOUT_BYTES = TILE_LAYOUT_CONTENT.encode('ascii')
+BINGO_POSITION_BYTES = BINGO_POSITION_CONTENT.encode('ascii')
+
+# Figure única reutilizada pelos plots em modo batch (ver plot_station_layout)
+_BATCH_FIG = None
+
+def _get_batch_figure():
+    """Retorna a Figure compartilhada do modo batch, já limpa para redesenho."""
+    global _BATCH_FIG
+    if _BATCH_FIG is None:
+        _BATCH_FIG = _plt().figure(figsize=(10, 10), dpi=100)
+    _BATCH_FIG.clear()
+    return _BATCH_FIG
+
+def plot_station_layout(
+    station_antennas_layout_array: np.ndarray, # Layout de TODAS as antenas
+    station_centers_layout_array: np.ndarray, # Layout dos CENTROS dos tiles
+    title: str = "Layout da Estação",
+    save_path: str = None # Se definido, salva PNG em vez de abrir janela
+    ) -> bool:
+    """
+    Plota a disposição das antenas individuais e os centros dos tiles.
+    Ambos os arrays devem estar em METROS.
+
+    Se save_path for fornecido (modo batch), a figura é salva em PNG sem
+    bloquear em plt.show().
+    """
+    antennas_valid = isinstance(station_antennas_layout_array, np.ndarray) and station_antennas_layout_array.ndim == 2 and station_antennas_layout_array.shape[1] >= 2
+    centers_valid = isinstance(station_centers_layout_array, np.ndarray) and station_centers_layout_array.ndim == 2 and station_centers_layout_array.shape[1] >= 2
+
+    if not antennas_valid and not centers_valid:
+        print("Erro: Nenhum dado válido para plotar (antenas ou centros).")
+        return False
+    if antennas_valid and station_antennas_layout_array.shape[0] == 0 and centers_valid and station_centers_layout_array.shape[0] == 0:
+         print("Aviso: Arrays de antenas e centros vazios. Nada para plotar.")
+         return True # Retorna True pois não houve erro, apenas nada a fazer
+
+    if save_path:
+        # Modo batch: reutiliza uma única Figure entre os 16 layouts
+        # (fig.clear() evita recriar canvas/toolbar e o vazamento de memória
+        # de figuras nunca fechadas)
+        fig = _get_batch_figure()
+    else:
+        fig = _plt().figure(figsize=(10, 10), dpi=100)
+    ax = fig.add_subplot(111)
+
+    # Plota antenas individuais (se houver)
+    if antennas_valid and station_antennas_layout_array.shape[0] > 0:
+        num_antennas = station_antennas_layout_array.shape[0]
+        # Ajusta o tamanho do marcador baseado no número de antenas
+        marker_size = max(1, 7 - np.log10(num_antennas)) if num_antennas > 1 else 5
+        # rasterized=True colapsa os milhares de pontos numa única camada
+        # raster (pan/zoom fluido e arquivos de figura pequenos); os centros
+        # dos tiles e os eixos continuam vetoriais
+        ax.scatter(station_antennas_layout_array[:, 0], station_antennas_layout_array[:, 1],
+                   marker='.', s=marker_size, label=f"Antenas ({num_antennas})",
+                   alpha=0.5, zorder=1, rasterized=True)
+
+    # Plota centros dos tiles (se houver)
+    if centers_valid and station_centers_layout_array.shape[0] > 0:
+         num_centers = station_centers_layout_array.shape[0]
+         ax.scatter(station_centers_layout_array[:, 0], station_centers_layout_array[:, 1],
+                    marker='x', s=50, color='red', label=f"Centros Tiles ({num_centers})", zorder=2)
+
+    ax.set_xlabel("X (metros)")
+    ax.set_ylabel("Y (metros)")
+    ax.set_title(title, fontsize=14)
+    ax.set_aspect('equal', adjustable='box')
+    ax.grid(True, linestyle='--', alpha=0.6)
+    ax.legend()
+    if save_path:
+        # Modo batch: salva a figura e segue sem bloquear (a Figure é
+        # mantida viva para reutilização no próximo layout)
+        try:
+            fig.savefig(save_path, dpi=90)
+            print(f"Gráfico salvo em: {save_path}")
+            return True
+        except Exception as e:
+            print(f"Erro ao salvar o gráfico: {e}")
+            return False
+    print(f"\nExibindo gráfico: {title}")
+    print(">>> FECHE a janela do gráfico para continuar ou cancelar <<<")
+    try:
+        _plt().show()
+        return True # Gráfico foi exibido
+    except Exception as e:
+        print(f"Erro ao exibir o gráfico: {e}")
+        return False # Falha ao mostrar
+    finally:
+        # Libera a figura interativa (antes elas acumulavam entre layouts)
+        _plt().close(fig)
+
+# ==================== Controle de Paralelismo ====================
+
+def _available_cpus() -> int:
+    """
+    Número de CPUs realmente disponíveis para este processo: respeita
+    afinidade/cgroups (sched_getaffinity) onde existir, com os.cpu_count()
+    como fallback (Windows/macOS).
+    """
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+def _limit_worker_threads():
+    """
+    Initializer (ou parte dele) dos workers de processo: limita o BLAS/OpenMP
+    interno do NumPy a 1 thread. Com um processo por núcleo no pool externo,
+    deixar cada worker abrir nproc threads internas geraria nproc² threads
+    disputando cache e escalonador.
+    """
+    _ensure_log_listener()  # Filhos de fork precisam do próprio listener
+    for var in ('OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS'):
+        os.environ[var] = '1'
+    try:
+        # threadpoolctl (opcional) limita pools já inicializados — as
+        # variáveis de ambiente acima só valem para bibliotecas ainda não
+        # carregadas (caso spawn)
+        from threadpoolctl import threadpool_limits
+        threadpool_limits(limits=1)
+    except ImportError:
+        pass
+
+# ==================== Pré-renderização de Miniaturas (Paralela) ====================
+
+# View somente-leitura do tile base anexada pelo initializer dos workers; os
+# processos compartilham um único buffer em vez de cada um manter sua cópia
+_SHARED_TILE = None
+_TILE_SHM = None  # Referência mantida para o segmento não ser coletado
+
+def _attach_tile_shm(shm_name: str, shape, dtype_name: str):
+    """
+    Initializer dos workers de miniatura: anexa o segmento de memória
+    compartilhada com o tile base e expõe uma view NumPy somente-leitura.
+    Em caso de falha o worker cai no BASE_TILE_LAYOUT local (o literal do
+    próprio módulo), sem quebrar a renderização.
+    """
+    global _SHARED_TILE, _TILE_SHM
+    _limit_worker_threads()
+    try:
+        _TILE_SHM = shared_memory.SharedMemory(name=shm_name)
+        view = np.ndarray(shape, dtype=np.dtype(dtype_name), buffer=_TILE_SHM.buf)
+        view.flags.writeable = False
+        _SHARED_TILE = view
+    except Exception as e:
+        print(f"Aviso: worker não conseguiu anexar o tile compartilhado ({e}); usando cópia local.")
+        _SHARED_TILE = None
+
+def _render_thumbnail(args) -> str:
+    """
+    Worker de processo: calcula o layout de índice `config_index` e salva uma
+    miniatura PNG em `out_dir`. Recebe o índice (e não o LayoutConfig) para
+    manter o argumento trivialmente picklável; cada worker reimporta o módulo
+    e resolve a configuração localmente.
+    """
+    config_index, out_dir = args
+    plt = _plt()
+    plt.switch_backend('Agg')  # Workers renderizam direto para arquivo
+    layout_config = LAYOUT_CONFIGURATIONS_TO_RUN[config_index]
+    # Mesma semente usada na geração real: a miniatura mostra exatamente o
+    # layout que será emitido (inclusive nas variantes aleatórias)
+    bingo_layouts.seed_rng(zlib.crc32(layout_config.name.encode('utf-8')))
+    try:
+        centers = np.asarray(layout_config.layout_function(**layout_config.full_params),
+                             dtype=np.float64)
+    except Exception as e:
+        print(f"  Miniatura de '{layout_config.name}' falhou: {e}")
+        return ""
+    if centers.size == 0:
+        return ""
+    base_tile = _SHARED_TILE if _SHARED_TILE is not None else BASE_TILE_LAYOUT
+    # float32 basta para a miniatura (mesma razão do plot principal)
+    antennas = (centers[:, None, :] + base_tile[None, :, :]
+                ).reshape(-1, 2).astype(np.float32, copy=False)
+    png_path = os.path.join(out_dir, f"{layout_config.name}_thumb.png")
+    fig = plt.figure(figsize=(4, 4), dpi=75)
+    try:
+        ax = fig.add_subplot(111)
+        ax.scatter(antennas[:, 0], antennas[:, 1], marker='.', s=1,
+                   alpha=0.5, zorder=1, rasterized=True)
+        ax.scatter(centers[:, 0], centers[:, 1], marker='x', s=12,
+                   color='red', zorder=2)
+        ax.set_title(layout_config.name, fontsize=8)
+        ax.set_aspect('equal', adjustable='box')
+        ax.tick_params(labelsize=6)
+        fig.savefig(png_path, dpi=75)
+    finally:
+        plt.close(fig)
+    return png_path
+
+def prerender_thumbnails(output_dir: str) -> str:
+    """
+    Pré-renderiza miniaturas de TODAS as configurações em paralelo (um
+    processo por núcleo) e monta uma folha de contato única para revisão,
+    antes de qualquer confirmação interativa. Retorna o caminho da folha de
+    contato, ou "" se nada pôde ser renderizado.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    tasks = [(k, output_dir) for k in range(len(LAYOUT_CONFIGURATIONS_TO_RUN))]
+    print(f"Pré-renderizando {len(tasks)} miniaturas em paralelo...")
+    # Publica o tile base num segmento de memória compartilhada: os workers
+    # anexam uma view somente-leitura no initializer, em vez de cada tarefa
+    # serializar/copiar o array
+    shm = shared_memory.SharedMemory(create=True, size=BASE_TILE_LAYOUT.nbytes)
+    try:
+        shm_view = np.ndarray(BASE_TILE_LAYOUT.shape, dtype=BASE_TILE_LAYOUT.dtype,
+                              buffer=shm.buf)
+        shm_view[:] = BASE_TILE_LAYOUT
+        with ProcessPoolExecutor(
+                max_workers=min(_available_cpus(), len(tasks)),
+                initializer=_attach_tile_shm,
+                initargs=(shm.name, BASE_TILE_LAYOUT.shape,
+                          BASE_TILE_LAYOUT.dtype.str)) as executor:
+            thumb_paths = [path for path in executor.map(_render_thumbnail, tasks) if path]
+    finally:
+        del shm_view
+        shm.close()
+        shm.unlink()
+    if not thumb_paths:
+        print("Aviso: nenhuma miniatura pôde ser renderizada.")
+        return ""
+    try:
+        from PIL import Image
+    except ImportError:
+        print("Aviso: Pillow não instalado; miniaturas individuais salvas em "
+              f"'{output_dir}', sem folha de contato.")
+        return ""
+    # Folha de contato: cola as miniaturas numa grade de 4 colunas
+    images = [Image.open(path) for path in thumb_paths]
+    thumb_w, thumb_h = images[0].size
+    num_cols = 4
+    num_rows = math.ceil(len(images) / num_cols)
+    sheet = Image.new('RGB', (num_cols * thumb_w, num_rows * thumb_h), 'white')
+    for k, image in enumerate(images):
+        sheet.paste(image, ((k % num_cols) * thumb_w, (k // num_cols) * thumb_h))
+    sheet_path = os.path.join(output_dir, 'contact_sheet.png')
+    sheet.save(sheet_path)
+    print(f"Folha de contato com {len(images)} layouts salva em: {sheet_path}")
+    return sheet_path
+
+# ==================== Leitura do CSV de Outriggers ====================
+
+def load_arrangements(csv_input_path: str):
+    """
+    Lê e agrupa o CSV de outriggers UMA única vez.
+
+    Retorna um dicionário {ArrangementName: (stations_list, wgs84_bytes)}
+    com a lista de estações e o conteúdo de layout_wgs84.txt já formatado e
+    codificado (bytes ASCII) por arranjo, ou None em caso de erro crítico.
+    """
+    # Import local: pandas só é necessário nesta função (chamada uma vez por
+    # processo); fora dela o módulo carrega sem pagar o import
+    import pandas as pd
+    try:
+        print(f"Lendo e agrupando dados do CSV: {csv_input_path}")
+        expected_headers = ['ArrangementName', 'StationID', 'Latitude', 'Longitude', 'Altitude']
+        # Parser C do pandas: validação, strip e conversão de floats em lote,
+        # no lugar do laço Python linha a linha do csv.DictReader
+        df = pd.read_csv(csv_input_path, skipinitialspace=True, encoding='utf-8')
+        missing_headers = [header for header in expected_headers if header not in df.columns]
+        if missing_headers:
+            raise ValueError(f"Cabeçalhos CSV ausentes/incorretos. Esperado: {expected_headers}, Encontrado: {df.columns.tolist()}")
+        df = df[expected_headers].dropna(subset=['ArrangementName', 'StationID'])
+        df['ArrangementName'] = df['ArrangementName'].astype(str).str.strip()
+        df['StationID'] = df['StationID'].astype(str).str.strip()
+        for col in ('Latitude', 'Longitude', 'Altitude'):
+            df[col] = pd.to_numeric(df[col], errors='coerce')
+        num_rows_raw = len(df)
+        df = df[(df['ArrangementName'] != '') & (df['StationID'] != '')]
+        df = df.dropna(subset=['Latitude', 'Longitude', 'Altitude'])
+        num_invalid = num_rows_raw - len(df)
+        if num_invalid > 0:
+            print(f"Aviso: {num_invalid} linha(s) inválida(s) ignorada(s) no CSV.")
+        if df.empty:
+            raise ValueError("Nenhum arranjo válido lido do CSV.")
+        print(f"Dados lidos: {df['ArrangementName'].nunique()} arranjos do CSV, {len(df)} estações no total.")
+
+    except FileNotFoundError: print(f"Erro Crítico: Arquivo CSV não encontrado: {csv_input_path}"); return None
+    except pd.errors.EmptyDataError: print(f"Erro Crítico no formato ou conteúdo do CSV: CSV vazio ou ilegível."); return None
+    except ValueError as e: print(f"Erro Crítico no formato ou conteúdo do CSV: {e}"); return None
+    except Exception: logger.exception("Erro Crítico inesperado ao ler CSV"); return None
+
+    # Pré-formata o conteúdo de layout_wgs84.txt por arranjo (uma vez, e não
+    # uma vez por configuração de layout)
+    arrangements_data = {}
+    for arr_name, group in df.groupby('ArrangementName', sort=False):
+        stations_list = group[['StationID', 'Latitude', 'Longitude', 'Altitude']].to_dict('records')
+        wgs84_coords = group[['Latitude', 'Longitude', 'Altitude']].to_numpy().tolist()
+        # Codifica uma vez aqui (e não uma vez por configuração de layout)
+        arrangements_data[arr_name] = (
+            stations_list, format_layout_content_wgs84(wgs84_coords).encode('ascii'))
+    return arrangements_data
+
+# ==================== Função Principal de Geração OSKAR ====================
+
+@dataclass(frozen=True, slots=True)
+class LayoutConfig:
+    """
+    Configuração imutável de um layout de estação a gerar.
+
+    Substitui o dicionário {'name', 'layout_function', 'params'}: acesso por
+    atributo em slots dispensa os três hashes de dict por geração, e
+    full_params (params + dimensões do tile) é montado uma única vez na
+    construção em vez de um merge de dicts a cada chamada.
+    """
+    name: str
+    layout_function: Callable[..., np.ndarray]
+    params: Mapping[str, Any]
+    full_params: Dict[str, Any] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # params vira uma view somente-leitura: o registro é imutável de fato,
+        # não só no nível dos atributos
+        object.__setattr__(self, 'params', MappingProxyType(dict(self.params)))
+        object.__setattr__(self, 'full_params',
+                           dict(self.params) | {'tile_width_m': TILE_WIDTH,
+                                                'tile_height_m': TILE_HEIGHT})
+
+def create_oskar_structure_grouped(
+    csv_input_path: str,
+    output_base_path: str,
+    layout_config: LayoutConfig, # Configuração do layout (name, layout_function, params)
+    base_tile_layout: np.ndarray, # Layout pré-calculado das 64 antenas do tile
+    arrangements_data=None, # Dict pré-carregado de load_arrangements (opcional)
+    batch: bool = False, # Modo batch: salva PNG e gera sem pedir confirmação
+    _dirs_precreated: bool = False # True: o chamador já criou output_base_path
+    ):
+    """
+    Cria a estrutura OSKAR para um layout de estação específico, combinado com
+    os arranjos definidos no CSV.
+
+    Args:
+        csv_input_path (str): Caminho para o arquivo CSV (formato BINGO v3).
+        output_base_path (str): Caminho base para a pasta de saída dos telescópios (ex: .../layouts).
+        layout_config (LayoutConfig): Configuração do layout da estação a ser
+                               gerado (name, layout_function, params).
+        base_tile_layout (np.ndarray): Array (64, 2) com as posições das antenas dentro de um tile.
+        arrangements_data (Dict, opcional): Resultado de load_arrangements(), para
+                               evitar reparsear o CSV a cada layout. Se None,
+                               o CSV é lido aqui.
+
+    Returns:
+        True se TODOS os telescópios do layout foram gerados sem erro (é o
+        sinal usado pelos drivers para gravar o sentinela de conclusão);
+        False/None em caso de erro, cancelamento ou layout vazio.
+    """
+    layout_name = layout_config.name
+    layout_function = layout_config.layout_function
+
+    if not layout_function or not callable(layout_function):
+        logger.error("Erro Crítico: Função de layout inválida para '%s'. Abortando este layout.", layout_name)
+        return
+
+    # Progresso via logger: as mensagens só entram na fila aqui; formatação e
+    # escrita acontecem na thread do listener, sem serializar os workers no
+    # lock do stdout
+    logger.info("\n--- Iniciando Geração para Layout de Estação: '%s' ---", layout_name)
+    logger.info("Usando CSV: %s", csv_input_path)
+    logger.info("Diretório Base de Saída: %s", output_base_path)
+    logger.info("Função da Biblioteca: bingo_layouts.%s", layout_function.__name__)
+    logger.info("Parâmetros: %s", layout_config.params)
+
+    # --- 1. Calcular Layout da Estação (Centros dos Tiles) ---
+    logger.info("Calculando layout da estação (centros dos tiles em METROS)...")
+    station_centers_coords = []
+    try:
+        # Parâmetros completos (com dimensões do tile) já montados na
+        # construção do LayoutConfig
+        full_params = layout_config.full_params
+        # Semeia o RNG da biblioteca deterministicamente por layout: a
+        # variante "aleatoria" gera sempre a mesma perturbação (offsets
+        # sorteados em lote vetorizado dentro de bingo_layouts) entre execuções
+        bingo_layouts.seed_rng(zlib.crc32(layout_name.encode('utf-8')))
+        # Chama a função da biblioteca bingo_layouts com os parâmetros corretos
+        station_centers_coords = layout_function(**full_params)
+
+        # A biblioteca retorna np.ndarray (N, 2); asarray com dtype explícito
+        # é zero-cópia nesse caso e ainda aceita listas de listas de versões
+        # antigas sem a inferência de tipo do np.array()
+        station_centers_array = np.asarray(station_centers_coords, dtype=np.float64)
+        if station_centers_array.size == 0:
+            station_centers_array = np.empty((0, 2))
+        if station_centers_array.ndim != 2 or station_centers_array.shape[1] != 2:
+            logger.error("Erro: Função de layout não retornou coordenadas (N, 2). Abortando este layout.")
+            return
+
+    except Exception:
+        # logger.exception formata o traceback fora da thread chamadora
+        logger.exception("Erro Crítico ao calcular layout da estação '%s'", layout_name)
+        return
+
+    if station_centers_array.size == 0:
+        logger.warning("Aviso: Layout da estação '%s' resultou em 0 tiles. Pulando este layout.", layout_name)
+        return
+
+    num_tiles_per_station = station_centers_array.shape[0]
+    logger.info("Layout da estação '%s' calculado: %d centros de tiles.", layout_name, num_tiles_per_station)
+
+    # --- 2. Calcular Posições de TODAS as Antenas (para plotagem) ---
+    logger.info("Calculando posições de todas as antenas individuais (para visualização)...")
+    if base_tile_layout.size > 0 and num_tiles_per_station > 0:
+        # Translada o tile base para todos os centros de uma vez:
+        # (N_tiles, 1, 2) + (1, 64, 2) -> (N_tiles*64, 2), sem lista Python.
+        # float32 basta para o plot (7 dígitos significativos ~ mícrons) e
+        # move metade dos bytes no array grande de 64*N antenas; os arquivos
+        # de texto são emitidos a partir dos centros em float64.
+        all_antennas_array = (station_centers_array[:, None, :] +
+                              base_tile_layout[None, :, :]
+                              ).reshape(-1, 2).astype(np.float32, copy=False)
+    else:
+        all_antennas_array = np.empty((0, 2), dtype=np.float32)
+    num_total_antennas = all_antennas_array.shape[0]
+    logger.info("Total de antenas individuais calculadas: %d", num_total_antennas)
+
+    # --- 3. Visualizar Layout e Pedir Confirmação ---
+    plot_title = f"Layout Estação: '{layout_name}' ({num_tiles_per_station} Tiles, {num_total_antennas} Antenas)"
+    if batch:
+        # Modo batch: salva o PNG para auditoria posterior e auto-confirma,
+        # sem bloquear em plt.show()/input()
+        if not _dirs_precreated:
+            os.makedirs(output_base_path, exist_ok=True)
+        png_path = os.path.join(output_base_path, f"{layout_name}.png")
+        plot_station_layout(all_antennas_array, station_centers_array,
+                            title=plot_title, save_path=png_path)
+        logger.info("Modo batch: gerando arquivos para '%s' sem confirmação interativa.", layout_name)
+    else:
+        plot_shown = plot_station_layout(all_antennas_array, station_centers_array, title=plot_title)
+
+    if not batch:
+        if not plot_shown:
+             print("Aviso: Não foi possível exibir o gráfico do layout. Verifique o backend do Matplotlib.")
+             # Poderíamos parar aqui ou continuar assumindo que o layout está OK
+             # Por segurança, vamos parar se o plot falhar.
+             # print("Abortando este layout devido à falha na visualização.")
+             # return
+             # OU, permitir continuar com um aviso extra:
+             cont = input("AVISO: Gráfico não exibido. Continuar mesmo assim? (s/n): ").strip().lower()
+             if cont != 's':
+                  print("Operação cancelada pelo usuário.")
+                  return
+
+        # Confirmação do usuário
+        while True:
+            try:
+                user_input = input(f"Layout '{layout_name}' parece correto? Gerar arquivos? (s/n): ").strip().lower()
+                if user_input == 's':
+                    print(f"Confirmado. Gerando arquivos para o layout '{layout_name}'...")
+                    break
+                elif user_input == 'n':
+                    print(f"Layout '{layout_name}' cancelado pelo usuário.")
+                    return # Aborta a geração para ESTE layout
+                else:
+                    print("Entrada inválida. Digite 's' ou 'n'.")
+            except EOFError:
+                 print("\nEntrada interrompida. Operação cancelada.")
+                 return # Aborta tudo
+
+    # --- 4. Obter os Arranjos (pré-carregados, ou lendo o CSV se preciso) ---
+    if arrangements_data is None:
+        arrangements_data = load_arrangements(csv_input_path)
+        if arrangements_data is None:
+            return
+
+    # --- 5. Formatar Conteúdos Fixos (Layouts Internos) ---
+    # Tudo já em bytes ASCII: os quatro arquivos por telescópio são pequenos
+    # (<10 KB) e write_bytes evita o caminho codec+TextIOWrapper por arquivo.
+    # Layout do TILE (64 antenas): reaproveita os bytes pré-formatados quando
+    # o chamador usa o tile padrão; só reformata para tiles customizados
+    if base_tile_layout is BASE_TILE_LAYOUT:
+        tile_layout_bytes = TILE_LAYOUT_BYTES
+    else:
+        tile_layout_bytes = format_layout_content_xy(base_tile_layout).encode('ascii')
+    # Formata o layout da ESTAÇÃO (centros dos tiles) - Específico deste layout_config
+    station_layout_bytes = format_layout_content_xy(station_centers_array).encode('ascii')
+    # Posição do BINGO Central - pré-codificada no nível do módulo
+    bingo_position_bytes = BINGO_POSITION_BYTES
+
+    # --- 6. Criar Estrutura de Pastas e Arquivos por Arranjo CSV ---
+    logger.info("Criando estrutura de diretórios e arquivos para '%s'...", layout_name)
+    created_telescopes = 0
+    error_telescopes = 0
+
+    # Garante que o diretório base de saída exista (a menos que o chamador
+    # já tenha feito a checagem única de startup)
+    if not _dirs_precreated:
+        os.makedirs(output_base_path, exist_ok=True)
+
+    # Emite cada ARRANJO do CSV (ex: '50km_a', '100km_b') em paralelo:
+    # cada telescópio são 4 arquivos de texto independentes, I/O puro, e o
+    # GIL é liberado durante as escritas
+    output_base = Path(output_base_path)
+
+    def _emit_one_telescope(item):
+        csv_arrangement_name, (stations_list, layout_wgs84_bytes) = item
+        # Nome da pasta final combina o layout da estação e o arranjo do CSV
+        telescope_folder_name = f"{layout_name}_{csv_arrangement_name.replace(' ', '_').lower()}"
+        telescope_dir = output_base / telescope_folder_name
+        station_dir = telescope_dir / 'station'
+        tile_dir = station_dir / 'tile'
+        try:
+            # Um único mkdir cria toda a hierarquia; write_bytes abre em modo
+            # binário, escreve os bytes pré-codificados e fecha numa chamada
+            tile_dir.mkdir(parents=True, exist_ok=True)
+
+            # a) layout_wgs84.txt (Posições das Estações do CSV, pré-formatado)
+            (telescope_dir / 'layout_wgs84.txt').write_bytes(layout_wgs84_bytes)
+            # b) position.txt (Posição do BINGO Central)
+            (telescope_dir / 'position.txt').write_bytes(bingo_position_bytes)
+            # c) station/layout.txt (Layout da Estação - CENTROS dos tiles)
+            (station_dir / 'layout.txt').write_bytes(station_layout_bytes)
+            # d) station/tile/layout.txt (Layout do Tile - 64 antenas)
+            (tile_dir / 'layout.txt').write_bytes(tile_layout_bytes)
+            return telescope_folder_name, len(stations_list), None
+        except Exception as e:
+            return telescope_folder_name, len(stations_list), e
+
+    max_workers = min(8, max(1, len(arrangements_data)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(_emit_one_telescope, arrangements_data.items()))
+
+    # Formatação adiada (%s): a mensagem só é montada na thread do listener
+    for telescope_folder_name, num_stations, error in results:
+        if error is None:
+            logger.info("  Telescópio criado: %s (%d estações)", telescope_folder_name, num_stations)
+            created_telescopes += 1
+        else:
+            logger.error("  Erro ao criar '%s': %s", telescope_folder_name, error)
+            error_telescopes += 1
+
+    logger.info("--- Geração para Layout '%s' Concluída ---", layout_name)
+    logger.info("Telescópios criados com sucesso: %d", created_telescopes)
+    if error_telescopes > 0: logger.error("Erros durante a criação: %d", error_telescopes)
+    return error_telescopes == 0
+
+
+# ==================== Sentinelas de Conclusão (Execução Retomável) ====================
+# Cada layout concluído sem erros grava um arquivo-sentinela em
+# <saida>/.bingo_done/<nome_do_layout>. Em uma nova execução os layouts com
+# sentinela válido são pulados (a menos de --force), transformando a retomada
+# após uma interrupção em um trabalho O(restantes) em vez de O(todos).
+
+def _layout_done_path(output_base_path: str, layout_name: str) -> str:
+    """Caminho do arquivo-sentinela que marca um layout como concluído."""
+    return os.path.join(output_base_path, '.bingo_done', layout_name)
+
+def _layout_done_key(layout_config: LayoutConfig) -> str:
+    """
+    Chave de invalidação do sentinela: muda se os parâmetros/função do
+    layout, o tile base ou o CSV de entrada (tamanho+mtime) mudarem, para que
+    um sentinela antigo nunca esconda saídas defasadas.
+    """
+    try:
+        csv_stat = os.stat(CSV_INPUT_FILE)
+        csv_signature = (csv_stat.st_size, csv_stat.st_mtime_ns)
+    except OSError:
+        csv_signature = None
+    payload = repr((layout_config.layout_function.__name__,
+                    sorted(layout_config.full_params.items()),
+                    csv_signature)).encode('utf-8')
+    return f"{zlib.crc32(payload + TILE_LAYOUT_BYTES):08x}"
+
+def _layout_already_done(output_base_path: str, layout_config: LayoutConfig) -> bool:
+    """True se o sentinela do layout existe e bate com a chave atual."""
+    sentinel = Path(_layout_done_path(output_base_path, layout_config.name))
+    try:
+        recorded_key = sentinel.read_text(encoding='ascii').strip()
+    except OSError:
+        return False
+    return recorded_key == _layout_done_key(layout_config)
+
+def _mark_layout_done(output_base_path: str, layout_config: LayoutConfig) -> None:
+    """Grava o sentinela de conclusão do layout (melhor esforço)."""
+    sentinel = _layout_done_path(output_base_path, layout_config.name)
+    try:
+        os.makedirs(os.path.dirname(sentinel), exist_ok=True)
+        Path(sentinel).write_text(_layout_done_key(layout_config) + '\n',
+                                  encoding='ascii')
+    except OSError as e:
+        print(f"Aviso: não foi possível gravar o sentinela de '{layout_config.name}' ({e}).")
+
+# ==================== Geração em Lote (Paralela) ====================
+
+# Arranjos pré-carregados pelo initializer dos workers de geração em lote:
+# enviados uma vez por worker, e não re-picklados a cada layout submetido
+_WORKER_ARRANGEMENTS = None
+
+def _init_layout_worker(arrangements_data):
+    """Initializer dos workers do modo batch: guarda os arranjos do CSV."""
+    global _WORKER_ARRANGEMENTS
+    _WORKER_ARRANGEMENTS = arrangements_data
+    _limit_worker_threads()
+    _plt().switch_backend('Agg')  # Workers nunca abrem janela
+
+def _run_one_layout(config_index: int) -> str:
+    """
+    Worker de processo: gera a estrutura completa da configuração de índice
+    `config_index` em modo batch. Recebe o índice (configuração resolvida
+    localmente após o reimport do módulo) para manter o payload picklado
+    mínimo, como em _render_thumbnail.
+    """
+    layout_conf = LAYOUT_CONFIGURATIONS_TO_RUN[config_index]
+    success = create_oskar_structure_grouped(
+        csv_input_path=CSV_INPUT_FILE,
+        output_base_path=OUTPUT_BASE_DIR,
+        layout_config=layout_conf,
+        base_tile_layout=BASE_TILE_LAYOUT,
+        arrangements_data=_WORKER_ARRANGEMENTS,
+        batch=True,
+        _dirs_precreated=True  # __main__ valida/cria os diretórios no startup
+    )
+    if success:
+        # Sentinela gravado no worker: se o processo pai morrer depois daqui,
+        # o layout ainda assim não será reprocessado na retomada
+        _mark_layout_done(OUTPUT_BASE_DIR, layout_conf)
+    return layout_conf.name
+
+def _run_layout_group(config_indices) -> List[str]:
+    """
+    Worker de processo: gera em sequência todas as variantes que usam a MESMA
+    função de layout. Agrupar por função amortiza o setup por função numa
+    única inicialização por processo (compilação JIT dos kernels do numba e
+    caches lru de bingo_layouts aquecem na primeira variante e são
+    reaproveitados nas seguintes).
+    """
+    return [_run_one_layout(k) for k in config_indices]
+
+# ==================== Definição dos Layouts a Gerar ====================
+
+# Dicionário mapeando nomes de variantes para parâmetros específicos
+# Você pode ajustar esses valores para refinar o que cada variante significa
+LAYOUT_VARIANTS = {
+    "padrao": {
+        # Usa os padrões de cada função de layout
+        "desc": "Configuração padrão da forma."
+    },
+    "espacada": {
+        # Aumenta fatores de espaçamento/raio
+        "spacing_factor_mult": 3, # Multiplicador para fatores de espaçamento linear
+        "radius_step_factor_mult": 1.5, # Multiplicador para passos/raios
+        "desc": "Tiles mais afastados uns dos outros."
+    },
+    "aleatoria": {
+        # Adiciona pequeno ruído gaussiano
+        "random_offset_stddev_m": 0.3 * TILE_DIAGONAL_M, # 30% da diagonal como desvio padrão
+        "desc": "Pequena perturbação aleatória nas posições."
+    },
+    "exponencial": {
+        # Prioriza modos de espaçamento exponencial
+        "spacing_mode": "center_exponential", # Para Grid, Rhombus, HexGrid
+        "arm_spacing_mode": "exponential",    # Para Spiral
+        "ring_spacing_mode": "exponential",   # Para Ring
+        "center_exp_scale_factor": 2,      # Fator de escala para center_exponential
+        "radius_step_factor_exp": 1.15,       # Fator multiplicativo para spiral/ring exponencial
+        "desc": "Espaçamento aumenta exponencialmente do centro ou entre passos."
+    }
+}
+
+# Lista de configurações de layout a serem geradas
+# Cada entrada é um dicionário com:
+#   - name: Nome descritivo (será usado no nome da pasta)
+#   - layout_function: Referência à função em bingo_layouts
+#   - params: Dicionário de parâmetros BASE para a função
+# As variantes modificarão esses parâmetros base.
+BASE_LAYOUT_CONFIGURATIONS = [
+    # ... (definições de circulo, quadrado, losango, espiral, phyllotaxis) ...
+    {
+        "shape_name": "circulo",
+        "base_params": {
+            "spacing_mode": 'linear', # Adiciona modo padrão
+            "spacing_x_factor": 1.0,
+            "spacing_y_factor": 1.0,
+            "center_exp_scale_factor": 4, # Padrão se mudar modo
+            # Params de offset/colisão adicionados depois pelas variantes
+        },
+        "layout_function": bingo_layouts.create_manual_circular_layout
+    },
+    {
+        "shape_name": "quadrado",
+        "base_params": {
+            "num_cols": 12,
+            "num_rows": 3,
+            "spacing_mode": 'linear',
+            "spacing_x_factor": 1,
+            "spacing_y_factor": 1,
+            "center_exp_scale_factor": 4,
+        },
+        "layout_function": bingo_layouts.create_grid_layout
+    },
+    {
+        "shape_name": "losango",
+        "base_params": {
+            "num_rows_half": 6,
+            "spacing_mode": 'linear',
+            "side_length_factor": 0.65,
+            "h_compress_factor": 0.785,
+            "v_compress_factor": 0.86,
+            "center_exp_scale_factor": 4,
+        },
+        "layout_function": bingo_layouts.create_rhombus_layout
+    },
+    {
+        "shape_name": "espiral",
+        "base_params": {
+            "num_arms": 3,
+            "tiles_per_arm": 12,
+            "arm_spacing_mode": 'linear',
+            "center_scale_mode": 'none', # Adiciona modo padrão
+            "radius_start_factor": 0.7,
+            "radius_step_factor": 0.3,
+            "center_exp_scale_factor": 1.1, # Padrão se mudar modo
+            "angle_step_rad": math.pi / 9,
+            "include_center_tile": False
+        },
+        "layout_function": bingo_layouts.create_spiral_layout
+    },
+    # {
+    #     "shape_name": "phyllotaxis",
+    #      "base_params": {
+    #          "num_tiles": 36,
+    #          "spacing_mode": 'linear', # Adiciona modo padrão
+    #          "scale_factor": 0.6,
+    #          "center_offset_factor": 0.05,
+    #          "center_exp_scale_factor": 1.1, # Padrão se mudar modo
+    #      },
+    #     "layout_function": bingo_layouts.create_phyllotaxis_layout
+    # },
+]
+
+# Expansão dirigida por tabela: cada variante é uma transformação pura
+# params -> params, e a lista final vira uma única list comprehension
+# formas x variantes (sem a cadeia if/elif nem os .copy()+setdefault por ramo)
+
+# Defaults de offset/colisão construídos uma única vez no import, em vez de
+# um literal novo a cada variante expandida
+_LAYOUT_DEFAULTS = {
+    "random_offset_stddev_m": 0.0,
+    "min_separation_factor": 1.05,
+    "max_placement_attempts": DEFAULT_MAX_PLACEMENT_ATTEMPTS,
+}
+
+def _with_collision_defaults(params: dict) -> dict:
+    """Acrescenta os parâmetros de offset/colisão padrão quando ausentes."""
+    # defaults | params: as chaves já presentes em params prevalecem
+    return _LAYOUT_DEFAULTS | params
+
+def _expand_spacing(params: dict) -> dict:
+    """Aplica os multiplicadores de espaçamento da variante 'espacada'."""
+    mods = LAYOUT_VARIANTS["espacada"]
+    mult = mods.get("spacing_factor_mult", 1.5)
+    step_mult = mods.get("radius_step_factor_mult", 1.5)
+    out = dict(params)
+    for key in ("spacing_x_factor", "spacing_y_factor", "side_length_factor",
+                "spacing_factor", "scale_factor"):
+        if key in out:
+            out[key] *= mult
+    # radius_step_factor só é multiplicado no modo linear
+    if "radius_step_factor" in out and out.get("arm_spacing_mode", 'linear') == 'linear':
+        out["radius_step_factor"] *= step_mult
+    return out
+
+def _variant_padrao(params: dict) -> dict:
+    return _with_collision_defaults(dict(params))
+
+def _variant_espacada(params: dict) -> dict:
+    return _with_collision_defaults(_expand_spacing(params))
+
+def _variant_aleatoria(params: dict) -> dict:
+    # Parte dos parâmetros de "espacada" e acrescenta a perturbação gaussiana
+    mods = LAYOUT_VARIANTS["aleatoria"]
+    return _with_collision_defaults(_expand_spacing(params) | {
+        "random_offset_stddev_m": mods.get("random_offset_stddev_m", 0.05 * TILE_DIAGONAL_M),
+        "min_separation_factor": mods.get("min_separation_factor", 1.01),
+    })
+
+def _variant_exponencial(params: dict) -> dict:
+    mods = LAYOUT_VARIANTS["exponencial"]
+    out = dict(params)
+    if "spacing_mode" in out:
+        out["spacing_mode"] = mods.get("spacing_mode", 'center_exponential')
+        out["center_exp_scale_factor"] = mods.get("center_exp_scale_factor", 1.15)
+    if "arm_spacing_mode" in out:
+        out["arm_spacing_mode"] = mods.get("arm_spacing_mode", 'exponential')
+        out["radius_step_factor"] = mods.get("radius_step_factor_exp", 1.15)
+    if "ring_spacing_mode" in out:
+        out["ring_spacing_mode"] = mods.get("ring_spacing_mode", 'exponential')
+        out["radius_step_factor"] = mods.get("radius_step_factor_exp", 1.15)
+    if "center_scale_mode" in out: # Para espiral, anel, etc.
+        out["center_scale_mode"] = mods.get("spacing_mode", 'center_exponential')
+        out["center_exp_scale_factor"] = mods.get("center_exp_scale_factor", 1.15)
+    return _with_collision_defaults(out)
+
+VARIANT_TRANSFORMS: Dict[str, Callable[[dict], dict]] = {
+    "padrao": _variant_padrao,
+    "espacada": _variant_espacada,
+    "aleatoria": _variant_aleatoria,
+    "exponencial": _variant_exponencial,
+}
+
+def _build_layout_config(base_config: Dict[str, Any], variant_name: str) -> LayoutConfig:
+    """Constrói o LayoutConfig final de uma combinação forma x variante."""
+    shape_name = base_config["shape_name"]
+    layout_name = f"{shape_name}_{variant_name}"
+    params = VARIANT_TRANSFORMS[variant_name](base_config["base_params"])
+    # Comportamento especial para Manual Circular em modo exponencial: os
+    # fatores X/Y são ignorados pelo scaling exponencial; fixa em 1.0
+    if shape_name == "circulo" and variant_name == "exponencial" \
+            and params.get("spacing_mode") == 'center_exponential':
+        params |= {"spacing_x_factor": 1.0, "spacing_y_factor": 1.0}
+        print(f"  Ajuste para {layout_name}: Usando spacing_mode='center_exponential', fatores X/Y ignorados para cálculo base.")
+    return LayoutConfig(name=layout_name,
+                        layout_function=base_config["layout_function"],
+                        params=params)
+
+print("Definindo configurações de layout para execução...") # Debug print
+# Tupla (e não lista): a coleção em si também é imutável e um pouco mais
+# compacta; todo consumo é por índice/iteração
+LAYOUT_CONFIGURATIONS_TO_RUN = tuple(
+    _build_layout_config(base_config, variant_name)
+    for base_config in BASE_LAYOUT_CONFIGURATIONS
+    for variant_name in LAYOUT_VARIANTS
+)
+print(f"Total de {len(LAYOUT_CONFIGURATIONS_TO_RUN)} configurações de layout definidas.")
+
+# Filtro opcional por variável de ambiente: BINGO_ONLY="nome1,nome2" restringe
+# a execução a um subconjunto de layouts sem tocar nos demais. Aplicado aqui,
+# no módulo, ANTES dos grupos por função: assim os índices usados pelos
+# workers (miniaturas e modo batch) referem-se sempre à mesma tupla filtrada,
+# em qualquer processo (os workers herdam o ambiente e refazem o filtro).
+_only_names = {name.strip() for name in os.environ.get('BINGO_ONLY', '').split(',')
+               if name.strip()}
+if _only_names:
+    _unknown_names = _only_names - {cfg.name for cfg in LAYOUT_CONFIGURATIONS_TO_RUN}
+    if _unknown_names:
+        print(f"Aviso: BINGO_ONLY contém nomes desconhecidos (ignorados): {sorted(_unknown_names)}")
+    LAYOUT_CONFIGURATIONS_TO_RUN = tuple(
+        cfg for cfg in LAYOUT_CONFIGURATIONS_TO_RUN if cfg.name in _only_names)
+    print(f"BINGO_ONLY ativo: {len(LAYOUT_CONFIGURATIONS_TO_RUN)} configuração(ões) selecionada(s).")
+
+# Índices das configurações agrupados por identidade da função de layout
+# (as variantes de uma mesma forma compartilham o setup por função; ver
+# _run_layout_group). A ordem de execução segue a ordem de definição.
+_groups_by_function: Dict[Callable, List[int]] = {}
+for _k, _cfg in enumerate(LAYOUT_CONFIGURATIONS_TO_RUN):
+    _groups_by_function.setdefault(_cfg.layout_function, []).append(_k)
+LAYOUT_GROUPS_BY_FUNCTION = list(_groups_by_function.values())
+
+
+# ==================== Execução Principal ====================
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(
+        description="Gerador de estrutura de telescópio OSKAR (BINGO).")
+    parser.add_argument(
+        '--batch', action='store_true',
+        help="Modo não interativo: salva os gráficos em PNG no diretório de "
+             "saída e gera todos os layouts sem pedir confirmação.")
+    parser.add_argument(
+        '--force', action='store_true',
+        help="Reprocessa inclusive layouts já concluídos em execuções "
+             "anteriores (ignora os sentinelas .bingo_done).")
+    args = parser.parse_args()
+
+    if args.batch:
+        # Backend Agg: renderiza direto para arquivo, sem inicializar GUI.
+        # Importar matplotlib já aqui também aquece o módulo ANTES do fork:
+        # os workers herdam as páginas por copy-on-write.
+        _plt().switch_backend('Agg')
+
+    print("======================================================")
+    print("   Gerador de Estrutura de Telescópio OSKAR (BINGO)   ")
+    print("======================================================")
+    print(f"Usando biblioteca de layouts: bingo_layouts.py")
+    print(f"Dimensões de referência do Tile: {TILE_WIDTH:.2f}m x {TILE_HEIGHT:.2f}m")
+    print(f"Arquivo CSV de entrada: {CSV_INPUT_FILE}")
+    print(f"Diretório base de saída: {OUTPUT_BASE_DIR}")
+    print(f"Número de layouts a processar: {len(LAYOUT_CONFIGURATIONS_TO_RUN)}")
+    print("------------------------------------------------------")
+
+    if not LAYOUT_CONFIGURATIONS_TO_RUN:
+        print("Erro Fatal: BINGO_ONLY não corresponde a nenhum layout definido. Abortando.")
+        exit()
+
+    # Fail-fast: um único passe de validação/criação no filesystem antes de
+    # qualquer trabalho (stat do CSV + criação do diretório base), em vez de
+    # re-checagens espalhadas pelos layouts
+    try:
+        csv_stat = os.stat(CSV_INPUT_FILE)
+    except OSError as e:
+        print(f"Erro Fatal: Arquivo CSV não encontrado/ilegível em: {CSV_INPUT_FILE} ({e})")
+        exit()
+    if csv_stat.st_size == 0:
+        print(f"Erro Fatal: Arquivo CSV vazio: {CSV_INPUT_FILE}")
+        exit()
+    try:
+        os.makedirs(OUTPUT_BASE_DIR, exist_ok=True)
+    except OSError as e:
+        print(f"Erro Fatal: Não foi possível criar o diretório de saída '{OUTPUT_BASE_DIR}': {e}")
+        exit()
+
+    # Layout do TILE (64 antenas): constante pré-computada do módulo (a
+    # contagem é garantida pelo assert de __debug__ sobre o literal)
+    the_base_tile_layout = BASE_TILE_LAYOUT
+    print(f"Usando layout base do tile pré-computado ({the_base_tile_layout.shape[0]} antenas).")
+
+    # Lê e agrupa o CSV de outriggers uma única vez para todos os layouts
+    the_arrangements_data = load_arrangements(CSV_INPUT_FILE)
+    if the_arrangements_data is None:
+        print("Erro Fatal: Falha ao carregar os arranjos do CSV. Abortando.")
+        exit()
+
+    if not args.batch:
+        # Pré-renderiza as miniaturas de todos os layouts em paralelo e mostra
+        # uma folha de contato ANTES da revisão interativa: o usuário vê o
+        # conjunto completo de uma vez, enquanto os núcleos fazem o trabalho
+        sheet_path = prerender_thumbnails(os.path.join(OUTPUT_BASE_DIR, '_thumbnails'))
+        if sheet_path:
+            plt = _plt()
+            try:
+                sheet_fig = plt.figure(figsize=(12, 12))
+                sheet_ax = sheet_fig.add_subplot(111)
+                sheet_ax.imshow(plt.imread(sheet_path))
+                sheet_ax.set_axis_off()
+                sheet_ax.set_title("Prévia de todos os layouts (feche para iniciar a revisão)")
+                plt.show()
+            except Exception as e:
+                print(f"Aviso: não foi possível exibir a folha de contato ({e}). "
+                      f"Abra manualmente: {sheet_path}")
+            finally:
+                plt.close('all')
+
+    # Retomada: layouts com sentinela válido de execuções anteriores são
+    # pulados (a menos de --force) — só o que falta é reprocessado
+    if args.force:
+        pending_indices = set(range(len(LAYOUT_CONFIGURATIONS_TO_RUN)))
+    else:
+        pending_indices = set()
+        for k, layout_conf in enumerate(LAYOUT_CONFIGURATIONS_TO_RUN):
+            if _layout_already_done(OUTPUT_BASE_DIR, layout_conf):
+                print(f"Pulando '{layout_conf.name}': já concluído em execução "
+                      f"anterior (use --force para refazer).")
+            else:
+                pending_indices.add(k)
+
+    if not pending_indices:
+        print("\nNada a fazer: todos os layouts já foram concluídos.")
+    elif args.batch:
+        # Modo batch: cada configuração é independente (mesmo tile, mesmo
+        # CSV, pastas de saída distintas), então o laço vira um pool de
+        # processos — um layout por worker, saturando os núcleos. Os arranjos
+        # são enviados uma única vez por worker via initializer.
+        pending_groups = [[k for k in group if k in pending_indices]
+                          for group in LAYOUT_GROUPS_BY_FUNCTION]
+        pending_groups = [group for group in pending_groups if group]
+        num_layouts = len(pending_indices)
+        num_groups = len(pending_groups)
+        max_workers = min(_available_cpus(), num_groups)
+        print(f"\nModo batch: gerando {num_layouts} layouts "
+              f"({num_groups} grupos por função) em {max_workers} processos...")
+        import multiprocessing
+        if multiprocessing.get_start_method() == 'fork':
+            # Sob fork os filhos herdam o módulo com os arranjos já
+            # carregados: as páginas são compartilhadas por copy-on-write,
+            # sem pickle algum por worker
+            _WORKER_ARRANGEMENTS = the_arrangements_data
+            pool_kwargs = dict(initializer=_limit_worker_threads)
+        else:
+            # spawn (Windows): envia os arranjos uma vez por worker via
+            # initializer, e não uma vez por layout submetido
+            pool_kwargs = dict(initializer=_init_layout_worker,
+                               initargs=(the_arrangements_data,))
+        with ProcessPoolExecutor(max_workers=max_workers, **pool_kwargs) as executor:
+            # Uma tarefa por GRUPO de função: cada worker gera as variantes
+            # daquela função em sequência, reaproveitando o setup por função
+            future_to_group = {executor.submit(_run_layout_group, group): group
+                               for group in pending_groups}
+            done_count = 0
+            for future in as_completed(future_to_group):
+                group = future_to_group[future]
+                try:
+                    for finished_name in future.result():
+                        done_count += 1
+                        print(f"===== Layout {finished_name} concluído ({done_count}/{num_layouts}) =====")
+                except Exception:
+                    group_names = [LAYOUT_CONFIGURATIONS_TO_RUN[k].name for k in group]
+                    logger.exception("Falha ao gerar o grupo de layouts %s", group_names)
+    else:
+        # Modo interativo: sequencial por construção (plt.show + input())
+        for i, layout_conf in enumerate(LAYOUT_CONFIGURATIONS_TO_RUN):
+            if i not in pending_indices:
+                continue
+            print(f"\n===== Processando Layout {i+1}/{len(LAYOUT_CONFIGURATIONS_TO_RUN)} =====")
+            success = create_oskar_structure_grouped(
+                csv_input_path=CSV_INPUT_FILE,
+                output_base_path=OUTPUT_BASE_DIR,
+                layout_config=layout_conf,
+                base_tile_layout=the_base_tile_layout,
+                arrangements_data=the_arrangements_data,
+                batch=args.batch,
+                _dirs_precreated=True
+            )
+            if success:
+                _mark_layout_done(OUTPUT_BASE_DIR, layout_conf)
+            print(f"===== Layout {layout_conf.name} concluído =====")
+
+    print("\n======================================================")
+    print("Processamento de todos os layouts concluído.")
     print("======================================================")
\ No newline at end of file